@@ -0,0 +1,34 @@
+"""JSON encoding and decoding for the Ash Python SDK.
+
+This module is hand-written (not auto-generated) and is preserved across SDK
+regeneration by generate.sh.
+
+Uses orjson when it is installed (``pip install ash-ai-sdk[speedups]``) and
+falls back to the standard library otherwise. Both accept ``bytes``, so
+response bodies can be decoded without first building a ``str``, and
+``dumps`` always returns UTF-8 ``bytes`` ready to send as a request body.
+``loads_str`` is for callers that already hold a ``str``, such as decoded
+SSE frames.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    from orjson import dumps, loads
+
+    loads_str = loads
+except ImportError:
+    import json
+    from json import loads
+
+    # Bound once: skips json.loads' per-call type and keyword checks
+    loads_str = json.JSONDecoder().decode
+
+    def dumps(obj: Any) -> bytes:
+        # Same compact encoding httpx applies to ``json=`` request bodies
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+
+__all__ = ["dumps", "loads", "loads_str"]
@@ -5,6 +5,7 @@ from urllib.parse import quote
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.get_api_agents_name_files_response_200 import (
@@ -30,12 +31,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | GetApiAgentsNameFilesResponse200 | None:
     if response.status_code == 200:
-        response_200 = GetApiAgentsNameFilesResponse200.from_dict(response.json())
+        response_200 = GetApiAgentsNameFilesResponse200.from_dict(loads(response.content))
 
         return response_200
 
     if response.status_code == 404:
-        response_404 = ApiError.from_dict(response.json())
+        response_404 = ApiError.from_dict(loads(response.content))
 
         return response_404
 
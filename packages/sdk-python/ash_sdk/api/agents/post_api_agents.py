@@ -4,6 +4,7 @@ from typing import Any
 import httpx
 
 from ... import errors
+from ..._json import dumps, loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.post_api_agents_body import PostApiAgentsBody
@@ -22,7 +23,7 @@ def _get_kwargs(
         "url": "/api/agents",
     }
 
-    _kwargs["json"] = body.to_dict()
+    _kwargs["content"] = dumps(body.to_dict())
 
     headers["Content-Type"] = "application/json"
 
@@ -34,12 +35,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | PostApiAgentsResponse201 | None:
     if response.status_code == 201:
-        response_201 = PostApiAgentsResponse201.from_dict(response.json())
+        response_201 = PostApiAgentsResponse201.from_dict(loads(response.content))
 
         return response_201
 
     if response.status_code == 400:
-        response_400 = ApiError.from_dict(response.json())
+        response_400 = ApiError.from_dict(loads(response.content))
 
         return response_400
 
@@ -4,6 +4,7 @@ from typing import Any
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.get_api_queue_response_200 import GetApiQueueResponse200
 from ...models.get_api_queue_status import GetApiQueueStatus
@@ -18,7 +19,7 @@ def _get_kwargs(
     params: dict[str, Any] = {}
 
     json_status: str | Unset = UNSET
-    if not isinstance(status, Unset):
+    if status is not UNSET:
         json_status = status
 
     params["status"] = json_status
@@ -38,7 +39,7 @@ def _get_kwargs(
 
 def _parse_response(*, client: AuthenticatedClient | Client, response: httpx.Response) -> GetApiQueueResponse200 | None:
     if response.status_code == 200:
-        response_200 = GetApiQueueResponse200.from_dict(response.json())
+        response_200 = GetApiQueueResponse200.from_dict(loads(response.content))
 
         return response_200
 
@@ -6,6 +6,7 @@ from uuid import UUID
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.get_api_queue_id_response_200 import GetApiQueueIdResponse200
@@ -29,12 +30,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | GetApiQueueIdResponse200 | None:
     if response.status_code == 200:
-        response_200 = GetApiQueueIdResponse200.from_dict(response.json())
+        response_200 = GetApiQueueIdResponse200.from_dict(loads(response.content))
 
         return response_200
 
     if response.status_code == 404:
-        response_404 = ApiError.from_dict(response.json())
+        response_404 = ApiError.from_dict(loads(response.content))
 
         return response_404
 
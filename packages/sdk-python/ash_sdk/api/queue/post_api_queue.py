@@ -4,6 +4,7 @@ from typing import Any
 import httpx
 
 from ... import errors
+from ..._json import dumps, loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.post_api_queue_body import PostApiQueueBody
@@ -22,7 +23,7 @@ def _get_kwargs(
         "url": "/api/queue",
     }
 
-    _kwargs["json"] = body.to_dict()
+    _kwargs["content"] = dumps(body.to_dict())
 
     headers["Content-Type"] = "application/json"
 
@@ -34,12 +35,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | PostApiQueueResponse201 | None:
     if response.status_code == 201:
-        response_201 = PostApiQueueResponse201.from_dict(response.json())
+        response_201 = PostApiQueueResponse201.from_dict(loads(response.content))
 
         return response_201
 
     if response.status_code == 400:
-        response_400 = ApiError.from_dict(response.json())
+        response_400 = ApiError.from_dict(loads(response.content))
 
         return response_400
 
@@ -4,6 +4,7 @@ from typing import Any
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.get_api_sessions_response_200 import GetApiSessionsResponse200
 from ...types import UNSET, Response, Unset
@@ -32,7 +33,7 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> GetApiSessionsResponse200 | None:
     if response.status_code == 200:
-        response_200 = GetApiSessionsResponse200.from_dict(response.json())
+        response_200 = GetApiSessionsResponse200.from_dict(loads(response.content))
 
         return response_200
 
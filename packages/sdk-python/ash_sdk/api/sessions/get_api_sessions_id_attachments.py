@@ -6,6 +6,7 @@ from uuid import UUID
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.get_api_sessions_id_attachments_response_200 import (
@@ -31,12 +32,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | GetApiSessionsIdAttachmentsResponse200 | None:
     if response.status_code == 200:
-        response_200 = GetApiSessionsIdAttachmentsResponse200.from_dict(response.json())
+        response_200 = GetApiSessionsIdAttachmentsResponse200.from_dict(loads(response.content))
 
         return response_200
 
     if response.status_code == 404:
-        response_404 = ApiError.from_dict(response.json())
+        response_404 = ApiError.from_dict(loads(response.content))
 
         return response_404
 
@@ -6,6 +6,7 @@ from uuid import UUID
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.get_api_sessions_id_files_include_hidden import (
@@ -25,7 +26,7 @@ def _get_kwargs(
     params: dict[str, Any] = {}
 
     json_include_hidden: str | Unset = UNSET
-    if not isinstance(include_hidden, Unset):
+    if include_hidden is not UNSET:
         json_include_hidden = include_hidden
 
     params["includeHidden"] = json_include_hidden
@@ -47,12 +48,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | GetApiSessionsIdFilesResponse200 | None:
     if response.status_code == 200:
-        response_200 = GetApiSessionsIdFilesResponse200.from_dict(response.json())
+        response_200 = GetApiSessionsIdFilesResponse200.from_dict(loads(response.content))
 
         return response_200
 
     if response.status_code == 404:
-        response_404 = ApiError.from_dict(response.json())
+        response_404 = ApiError.from_dict(loads(response.content))
 
         return response_404
 
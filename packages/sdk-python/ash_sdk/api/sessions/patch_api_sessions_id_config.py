@@ -6,6 +6,7 @@ from uuid import UUID
 import httpx
 
 from ... import errors
+from ..._json import dumps, loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.patch_api_sessions_id_config_body import PatchApiSessionsIdConfigBody
@@ -29,7 +30,7 @@ def _get_kwargs(
         ),
     }
 
-    _kwargs["json"] = body.to_dict()
+    _kwargs["content"] = dumps(body.to_dict())
 
     headers["Content-Type"] = "application/json"
 
@@ -41,12 +42,12 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | PatchApiSessionsIdConfigResponse200 | None:
     if response.status_code == 200:
-        response_200 = PatchApiSessionsIdConfigResponse200.from_dict(response.json())
+        response_200 = PatchApiSessionsIdConfigResponse200.from_dict(loads(response.content))
 
         return response_200
 
     if response.status_code == 404:
-        response_404 = ApiError.from_dict(response.json())
+        response_404 = ApiError.from_dict(loads(response.content))
 
         return response_404
 
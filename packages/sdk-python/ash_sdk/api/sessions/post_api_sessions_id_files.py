@@ -6,6 +6,7 @@ from uuid import UUID
 import httpx
 
 from ... import errors
+from ..._json import dumps
 from ...client import AuthenticatedClient, Client
 from ...models.post_api_sessions_id_files_body import PostApiSessionsIdFilesBody
 from ...types import Response
@@ -25,7 +26,7 @@ def _get_kwargs(
         ),
     }
 
-    _kwargs["json"] = body.to_dict()
+    _kwargs["content"] = dumps(body.to_dict())
 
     headers["Content-Type"] = "application/json"
 
@@ -6,6 +6,7 @@ from uuid import UUID
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.post_api_sessions_id_fork_response_201 import (
@@ -31,22 +32,22 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | PostApiSessionsIdForkResponse201 | None:
     if response.status_code == 201:
-        response_201 = PostApiSessionsIdForkResponse201.from_dict(response.json())
+        response_201 = PostApiSessionsIdForkResponse201.from_dict(loads(response.content))
 
         return response_201
 
     if response.status_code == 404:
-        response_404 = ApiError.from_dict(response.json())
+        response_404 = ApiError.from_dict(loads(response.content))
 
         return response_404
 
     if response.status_code == 500:
-        response_500 = ApiError.from_dict(response.json())
+        response_500 = ApiError.from_dict(loads(response.content))
 
         return response_500
 
     if response.status_code == 503:
-        response_503 = ApiError.from_dict(response.json())
+        response_503 = ApiError.from_dict(loads(response.content))
 
         return response_503
 
@@ -6,6 +6,7 @@ from uuid import UUID
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.api_error import ApiError
 from ...models.post_api_sessions_id_resume_response_200 import (
@@ -31,27 +32,27 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ApiError | PostApiSessionsIdResumeResponse200 | None:
     if response.status_code == 200:
-        response_200 = PostApiSessionsIdResumeResponse200.from_dict(response.json())
+        response_200 = PostApiSessionsIdResumeResponse200.from_dict(loads(response.content))
 
         return response_200
 
     if response.status_code == 404:
-        response_404 = ApiError.from_dict(response.json())
+        response_404 = ApiError.from_dict(loads(response.content))
 
         return response_404
 
     if response.status_code == 410:
-        response_410 = ApiError.from_dict(response.json())
+        response_410 = ApiError.from_dict(loads(response.content))
 
         return response_410
 
     if response.status_code == 500:
-        response_500 = ApiError.from_dict(response.json())
+        response_500 = ApiError.from_dict(loads(response.content))
 
         return response_500
 
     if response.status_code == 503:
-        response_503 = ApiError.from_dict(response.json())
+        response_503 = ApiError.from_dict(loads(response.content))
 
         return response_503
 
@@ -6,6 +6,7 @@ from uuid import UUID
 import httpx
 
 from ... import errors
+from ..._json import loads
 from ...client import AuthenticatedClient, Client
 from ...models.get_api_usage_stats_response_200 import GetApiUsageStatsResponse200
 from ...types import UNSET, Response, Unset
@@ -21,19 +22,19 @@ def _get_kwargs(
     params: dict[str, Any] = {}
 
     json_session_id: str | Unset = UNSET
-    if not isinstance(session_id, Unset):
+    if session_id is not UNSET:
         json_session_id = str(session_id)
     params["sessionId"] = json_session_id
 
     params["agentName"] = agent_name
 
     json_after: str | Unset = UNSET
-    if not isinstance(after, Unset):
+    if after is not UNSET:
         json_after = after.isoformat()
     params["after"] = json_after
 
     json_before: str | Unset = UNSET
-    if not isinstance(before, Unset):
+    if before is not UNSET:
         json_before = before.isoformat()
     params["before"] = json_before
 
@@ -52,7 +53,7 @@ def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> GetApiUsageStatsResponse200 | None:
     if response.status_code == 200:
-        response_200 = GetApiUsageStatsResponse200.from_dict(response.json())
+        response_200 = GetApiUsageStatsResponse200.from_dict(loads(response.content))
 
         return response_200
 
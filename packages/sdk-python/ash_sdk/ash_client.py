@@ -11,11 +11,13 @@ low-level API functions that adds:
 
 from __future__ import annotations
 
+import threading
 from typing import Any, AsyncGenerator, Generator
 from uuid import UUID
 
 import httpx
 
+from ._json import dumps, loads
 from .models.agent import Agent
 from .models.health_response import HealthResponse
 from .models.post_api_agents_body import PostApiAgentsBody
@@ -30,26 +32,63 @@ from .models.post_api_sessions_body_mcp_servers_additional_property_env import (
 )
 from .models.post_api_sessions_body_subagents import PostApiSessionsBodySubagents
 from .models.session import Session
-from .streaming import AshEvent, parse_sse_stream, parse_sse_stream_async
+from .streaming import (
+    AshEvent,
+    coalesce_text_deltas,
+    coalesce_text_deltas_async,
+    parse_sse_batches,
+    parse_sse_batches_async,
+    parse_sse_stream,
+    parse_sse_stream_async,
+)
 from .types import UNSET
 
 
+def _message_body(
+    content: str,
+    *,
+    include_partial_messages: bool,
+    model: str | None,
+    max_turns: int | None,
+    max_budget_usd: float | None,
+    effort: str | None,
+    thinking: dict[str, Any] | None,
+    output_format: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Build the JSON body shared by the sync and async message stream methods."""
+    body: dict[str, Any] = {"content": content}
+    if include_partial_messages:
+        body["includePartialMessages"] = True
+    if model is not None:
+        body["model"] = model
+    if max_turns is not None:
+        body["maxTurns"] = max_turns
+    if max_budget_usd is not None:
+        body["maxBudgetUsd"] = max_budget_usd
+    if effort is not None:
+        body["effort"] = effort
+    if thinking is not None:
+        body["thinking"] = thinking
+    if output_format is not None:
+        body["outputFormat"] = output_format
+    return body
+
+
 class AshClient:
     """High-level client for the Ash API with SSE streaming support.
 
     Example::
 
-        client = AshClient("http://localhost:4100", token="my-api-key")
+        with AshClient("http://localhost:4100", token="my-api-key") as client:
+            # Create a session
+            session = client.create_session("my-agent", system_prompt="You are helpful.")
 
-        # Create a session
-        session = client.create_session("my-agent", system_prompt="You are helpful.")
+            # Stream messages
+            for event in client.send_message_stream(session.id, "Hello!"):
+                print(event)
 
-        # Stream messages
-        for event in client.send_message_stream(session.id, "Hello!"):
-            print(event)
-
-        # Clean up
-        client.end_session(session.id)
+            # Clean up
+            client.end_session(session.id)
     """
 
     def __init__(self, base_url: str, token: str | None = None, *, timeout: float = 300.0):
@@ -64,6 +103,50 @@ class AshClient:
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout
+        self._client: httpx.Client | None = None
+        self._pool_lock = threading.Lock()
+
+    def _http(self) -> httpx.Client:
+        """Return the pooled sync httpx client, creating it on first use."""
+        client = self._client
+        if client is None:
+            with self._pool_lock:
+                if self._client is None:
+                    self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
+                client = self._client
+        return client
+
+    def _ahttp(self) -> httpx.AsyncClient:
+        """Return a new async httpx client for a single stream.
+
+        Async connections are bound to the event loop that opened them, and a
+        caller may use each loop once (``asyncio.run()`` per call), so they are
+        not pooled; the caller closes the client when its stream ends.
+        """
+        return httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
+
+    def close(self) -> None:
+        """Close the underlying connection pool; async streams close their own client."""
+        with self._pool_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool; async streams close their own client."""
+        self.close()
+
+    def __enter__(self) -> AshClient:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> AshClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
 
     def _headers(self, *, content_type: str | None = "application/json", streaming: bool = False) -> dict[str, str]:
         headers: dict[str, str] = {}
@@ -76,22 +159,20 @@ class AshClient:
         return headers
 
     def _get(self, path: str) -> Any:
-        with httpx.Client(timeout=self.timeout) as c:
-            r = c.get(f"{self.base_url}{path}", headers=self._headers(content_type=None))
-            r.raise_for_status()
-            return r.json()
+        r = self._http().get(path, headers=self._headers(content_type=None))
+        r.raise_for_status()
+        return loads(r.content)
 
     def _post(self, path: str, json_body: Any = None) -> Any:
-        with httpx.Client(timeout=self.timeout) as c:
-            r = c.post(f"{self.base_url}{path}", headers=self._headers(), json=json_body)
-            r.raise_for_status()
-            return r.json()
+        content = dumps(json_body) if json_body is not None else None
+        r = self._http().post(path, headers=self._headers(), content=content)
+        r.raise_for_status()
+        return loads(r.content)
 
     def _delete(self, path: str) -> Any:
-        with httpx.Client(timeout=self.timeout) as c:
-            r = c.delete(f"{self.base_url}{path}", headers=self._headers(content_type=None))
-            r.raise_for_status()
-            return r.json()
+        r = self._http().delete(path, headers=self._headers(content_type=None))
+        r.raise_for_status()
+        return loads(r.content)
 
     # -- Health ----------------------------------------------------------------
 
@@ -109,7 +190,7 @@ class AshClient:
     def list_agents(self) -> list[Agent]:
         """List all deployed agents."""
         data = self._get("/api/agents")
-        return [Agent.from_dict(a) for a in data["agents"]]
+        return Agent.batch_from_dict(data["agents"])
 
     def get_agent(self, name: str) -> Agent:
         """Get agent details by name."""
@@ -193,7 +274,7 @@ class AshClient:
             params.append(f"status={status}")
         qs = f"?{'&'.join(params)}" if params else ""
         data = self._get(f"/api/sessions{qs}")
-        return [Session.from_dict(s) for s in data["sessions"]]
+        return Session.batch_from_dict(data["sessions"])
 
     def get_session(self, session_id: str | UUID) -> Session:
         """Get session details."""
@@ -244,6 +325,7 @@ class AshClient:
         effort: str | None = None,
         thinking: dict[str, Any] | None = None,
         output_format: dict[str, Any] | None = None,
+        coalesce: bool = False,
     ) -> Generator[AshEvent, None, None]:
         """Send a message and stream SSE events (synchronous).
 
@@ -257,34 +339,36 @@ class AshClient:
             effort: Effort level (``low``, ``medium``, ``high``, ``max``).
             thinking: Thinking configuration (e.g. ``{"type": "enabled", "budgetTokens": 10000}``).
             output_format: Output format constraint.
+            coalesce: Group consecutive ``TextDeltaEvent``s that arrive in the
+                      same network read into ``CoalescedTextDeltaEvent`` batches
+                      (up to 32 deltas each). Nothing is held back waiting for
+                      a later read.
 
         Yields:
             Typed event objects (MessageEvent, TextDeltaEvent, ErrorEvent, DoneEvent, etc.).
         """
-        body: dict[str, Any] = {"content": content}
-        if include_partial_messages:
-            body["includePartialMessages"] = True
-        if model is not None:
-            body["model"] = model
-        if max_turns is not None:
-            body["maxTurns"] = max_turns
-        if max_budget_usd is not None:
-            body["maxBudgetUsd"] = max_budget_usd
-        if effort is not None:
-            body["effort"] = effort
-        if thinking is not None:
-            body["thinking"] = thinking
-        if output_format is not None:
-            body["outputFormat"] = output_format
-
-        with httpx.Client(timeout=httpx.Timeout(self.timeout, read=None)) as c:
-            with c.stream(
-                "POST",
-                f"{self.base_url}/api/sessions/{session_id}/messages",
-                headers=self._headers(streaming=True),
-                json=body,
-            ) as response:
-                response.raise_for_status()
+        body = _message_body(
+            content,
+            include_partial_messages=include_partial_messages,
+            model=model,
+            max_turns=max_turns,
+            max_budget_usd=max_budget_usd,
+            effort=effort,
+            thinking=thinking,
+            output_format=output_format,
+        )
+
+        with self._http().stream(
+            "POST",
+            f"/api/sessions/{session_id}/messages",
+            headers=self._headers(streaming=True),
+            content=dumps(body),
+            timeout=httpx.Timeout(self.timeout, read=None),
+        ) as response:
+            response.raise_for_status()
+            if coalesce:
+                yield from coalesce_text_deltas(parse_sse_batches(response))
+            else:
                 yield from parse_sse_stream(response)
 
     async def asend_message_stream(
@@ -299,6 +383,7 @@ class AshClient:
         effort: str | None = None,
         thinking: dict[str, Any] | None = None,
         output_format: dict[str, Any] | None = None,
+        coalesce: bool = False,
     ) -> AsyncGenerator[AshEvent, None]:
         """Send a message and stream SSE events (asynchronous).
 
@@ -307,29 +392,31 @@ class AshClient:
         Yields:
             Typed event objects (MessageEvent, TextDeltaEvent, ErrorEvent, DoneEvent, etc.).
         """
-        body: dict[str, Any] = {"content": content}
-        if include_partial_messages:
-            body["includePartialMessages"] = True
-        if model is not None:
-            body["model"] = model
-        if max_turns is not None:
-            body["maxTurns"] = max_turns
-        if max_budget_usd is not None:
-            body["maxBudgetUsd"] = max_budget_usd
-        if effort is not None:
-            body["effort"] = effort
-        if thinking is not None:
-            body["thinking"] = thinking
-        if output_format is not None:
-            body["outputFormat"] = output_format
-
-        async with httpx.AsyncClient(timeout=httpx.Timeout(self.timeout, read=None)) as c:
-            async with c.stream(
+        body = _message_body(
+            content,
+            include_partial_messages=include_partial_messages,
+            model=model,
+            max_turns=max_turns,
+            max_budget_usd=max_budget_usd,
+            effort=effort,
+            thinking=thinking,
+            output_format=output_format,
+        )
+
+        async with (
+            self._ahttp() as http,
+            http.stream(
                 "POST",
-                f"{self.base_url}/api/sessions/{session_id}/messages",
+                f"/api/sessions/{session_id}/messages",
                 headers=self._headers(streaming=True),
-                json=body,
-            ) as response:
-                response.raise_for_status()
-                async for event in parse_sse_stream_async(response):
-                    yield event
+                content=dumps(body),
+                timeout=httpx.Timeout(self.timeout, read=None),
+            ) as response,
+        ):
+            response.raise_for_status()
+            if coalesce:
+                events = coalesce_text_deltas_async(parse_sse_batches_async(response))
+            else:
+                events = parse_sse_stream_async(response)
+            async for event in events:
+                yield event
@@ -1,129 +1,147 @@
-"""Contains all the data models used in inputs/outputs"""
+"""Contains all the data models used in inputs/outputs
 
-from .agent import Agent
-from .api_error import ApiError
-from .attachment import Attachment
-from .credential import Credential
-from .delete_api_agents_name_response_200 import DeleteApiAgentsNameResponse200
-from .delete_api_queue_id_response_200 import DeleteApiQueueIdResponse200
-from .delete_api_sessions_id_response_200 import DeleteApiSessionsIdResponse200
-from .get_api_agents_name_files_format import GetApiAgentsNameFilesFormat
-from .get_api_agents_name_files_response_200 import GetApiAgentsNameFilesResponse200
-from .get_api_agents_name_files_response_200_files_item import (
-    GetApiAgentsNameFilesResponse200FilesItem,
-)
-from .get_api_agents_name_response_200 import GetApiAgentsNameResponse200
-from .get_api_agents_response_200 import GetApiAgentsResponse200
-from .get_api_credentials_response_200 import GetApiCredentialsResponse200
-from .get_api_credentials_response_200_credentials_item import (
-    GetApiCredentialsResponse200CredentialsItem,
-)
-from .get_api_queue_id_response_200 import GetApiQueueIdResponse200
-from .get_api_queue_response_200 import GetApiQueueResponse200
-from .get_api_queue_stats_response_200 import GetApiQueueStatsResponse200
-from .get_api_queue_stats_response_200_stats import GetApiQueueStatsResponse200Stats
-from .get_api_queue_status import GetApiQueueStatus
-from .get_api_sessions_id_attachments_response_200 import (
-    GetApiSessionsIdAttachmentsResponse200,
-)
-from .get_api_sessions_id_events_response_200 import GetApiSessionsIdEventsResponse200
-from .get_api_sessions_id_files_format import GetApiSessionsIdFilesFormat
-from .get_api_sessions_id_files_include_hidden import GetApiSessionsIdFilesIncludeHidden
-from .get_api_sessions_id_files_response_200 import GetApiSessionsIdFilesResponse200
-from .get_api_sessions_id_files_response_200_files_item import (
-    GetApiSessionsIdFilesResponse200FilesItem,
-)
-from .get_api_sessions_id_files_response_200_source import (
-    GetApiSessionsIdFilesResponse200Source,
-)
-from .get_api_sessions_id_logs_response_200 import GetApiSessionsIdLogsResponse200
-from .get_api_sessions_id_logs_response_200_logs_item import (
-    GetApiSessionsIdLogsResponse200LogsItem,
-)
-from .get_api_sessions_id_logs_response_200_logs_item_level import (
-    GetApiSessionsIdLogsResponse200LogsItemLevel,
-)
-from .get_api_sessions_id_messages_response_200 import (
-    GetApiSessionsIdMessagesResponse200,
-)
-from .get_api_sessions_id_response_200 import GetApiSessionsIdResponse200
-from .get_api_sessions_response_200 import GetApiSessionsResponse200
-from .get_api_usage_response_200 import GetApiUsageResponse200
-from .get_api_usage_stats_response_200 import GetApiUsageStatsResponse200
-from .health_response import HealthResponse
-from .health_response_status import HealthResponseStatus
-from .message import Message
-from .message_role import MessageRole
-from .patch_api_sessions_id_config_body import PatchApiSessionsIdConfigBody
-from .patch_api_sessions_id_config_body_subagents import (
-    PatchApiSessionsIdConfigBodySubagents,
-)
-from .patch_api_sessions_id_config_response_200 import (
-    PatchApiSessionsIdConfigResponse200,
-)
-from .pool_stats import PoolStats
-from .post_api_agents_body import PostApiAgentsBody
-from .post_api_agents_body_files_item import PostApiAgentsBodyFilesItem
-from .post_api_agents_response_201 import PostApiAgentsResponse201
-from .post_api_credentials_body import PostApiCredentialsBody
-from .post_api_credentials_body_type import PostApiCredentialsBodyType
-from .post_api_credentials_response_201 import PostApiCredentialsResponse201
-from .post_api_credentials_response_201_credential import (
-    PostApiCredentialsResponse201Credential,
-)
-from .post_api_queue_body import PostApiQueueBody
-from .post_api_queue_response_201 import PostApiQueueResponse201
-from .post_api_sessions_body import PostApiSessionsBody
-from .post_api_sessions_body_extra_env import PostApiSessionsBodyExtraEnv
-from .post_api_sessions_body_mcp_servers import PostApiSessionsBodyMcpServers
-from .post_api_sessions_body_mcp_servers_additional_property import (
-    PostApiSessionsBodyMcpServersAdditionalProperty,
-)
-from .post_api_sessions_body_mcp_servers_additional_property_env import (
-    PostApiSessionsBodyMcpServersAdditionalPropertyEnv,
-)
-from .post_api_sessions_body_permission_mode import PostApiSessionsBodyPermissionMode
-from .post_api_sessions_body_subagents import PostApiSessionsBodySubagents
-from .post_api_sessions_id_attachments_body import PostApiSessionsIdAttachmentsBody
-from .post_api_sessions_id_attachments_response_201 import (
-    PostApiSessionsIdAttachmentsResponse201,
-)
-from .post_api_sessions_id_exec_body import PostApiSessionsIdExecBody
-from .post_api_sessions_id_exec_response_200 import PostApiSessionsIdExecResponse200
-from .post_api_sessions_id_files_body import PostApiSessionsIdFilesBody
-from .post_api_sessions_id_files_body_files_item import (
-    PostApiSessionsIdFilesBodyFilesItem,
-)
-from .post_api_sessions_id_fork_response_201 import PostApiSessionsIdForkResponse201
-from .post_api_sessions_id_messages_body import PostApiSessionsIdMessagesBody
-from .post_api_sessions_id_messages_body_effort import (
-    PostApiSessionsIdMessagesBodyEffort,
-)
-from .post_api_sessions_id_messages_body_output_format import (
-    PostApiSessionsIdMessagesBodyOutputFormat,
-)
-from .post_api_sessions_id_messages_body_output_format_schema import (
-    PostApiSessionsIdMessagesBodyOutputFormatSchema,
-)
-from .post_api_sessions_id_messages_body_thinking import (
-    PostApiSessionsIdMessagesBodyThinking,
-)
-from .post_api_sessions_id_pause_response_200 import PostApiSessionsIdPauseResponse200
-from .post_api_sessions_id_resume_response_200 import PostApiSessionsIdResumeResponse200
-from .post_api_sessions_id_stop_response_200 import PostApiSessionsIdStopResponse200
-from .post_api_sessions_id_workspace_body import PostApiSessionsIdWorkspaceBody
-from .post_api_sessions_id_workspace_response_200 import (
-    PostApiSessionsIdWorkspaceResponse200,
-)
-from .post_api_sessions_response_201 import PostApiSessionsResponse201
-from .queue_item import QueueItem
-from .queue_item_status import QueueItemStatus
-from .session import Session
-from .session_event import SessionEvent
-from .session_event_type import SessionEventType
-from .session_status import SessionStatus
-from .usage_event import UsageEvent
-from .usage_stats import UsageStats
+Submodules are imported lazily on first attribute access (PEP 562), so
+``import ash_sdk.models`` stays cheap when only a few models are used.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .agent import Agent
+    from .api_error import ApiError
+    from .attachment import Attachment
+    from .credential import Credential
+    from .delete_api_agents_name_response_200 import DeleteApiAgentsNameResponse200
+    from .delete_api_queue_id_response_200 import DeleteApiQueueIdResponse200
+    from .delete_api_sessions_id_response_200 import DeleteApiSessionsIdResponse200
+    from .get_api_agents_name_files_format import GetApiAgentsNameFilesFormat
+    from .get_api_agents_name_files_response_200 import GetApiAgentsNameFilesResponse200
+    from .get_api_agents_name_files_response_200_files_item import (
+        GetApiAgentsNameFilesResponse200FilesItem,
+    )
+    from .get_api_agents_name_response_200 import GetApiAgentsNameResponse200
+    from .get_api_agents_response_200 import GetApiAgentsResponse200
+    from .get_api_credentials_response_200 import GetApiCredentialsResponse200
+    from .get_api_credentials_response_200_credentials_item import (
+        GetApiCredentialsResponse200CredentialsItem,
+    )
+    from .get_api_queue_id_response_200 import GetApiQueueIdResponse200
+    from .get_api_queue_response_200 import GetApiQueueResponse200
+    from .get_api_queue_stats_response_200 import GetApiQueueStatsResponse200
+    from .get_api_queue_stats_response_200_stats import GetApiQueueStatsResponse200Stats
+    from .get_api_queue_status import GetApiQueueStatus
+    from .get_api_sessions_id_attachments_response_200 import (
+        GetApiSessionsIdAttachmentsResponse200,
+    )
+    from .get_api_sessions_id_events_response_200 import (
+        GetApiSessionsIdEventsResponse200,
+    )
+    from .get_api_sessions_id_files_format import GetApiSessionsIdFilesFormat
+    from .get_api_sessions_id_files_include_hidden import (
+        GetApiSessionsIdFilesIncludeHidden,
+    )
+    from .get_api_sessions_id_files_response_200 import GetApiSessionsIdFilesResponse200
+    from .get_api_sessions_id_files_response_200_files_item import (
+        GetApiSessionsIdFilesResponse200FilesItem,
+    )
+    from .get_api_sessions_id_files_response_200_source import (
+        GetApiSessionsIdFilesResponse200Source,
+    )
+    from .get_api_sessions_id_logs_response_200 import GetApiSessionsIdLogsResponse200
+    from .get_api_sessions_id_logs_response_200_logs_item import (
+        GetApiSessionsIdLogsResponse200LogsItem,
+    )
+    from .get_api_sessions_id_logs_response_200_logs_item_level import (
+        GetApiSessionsIdLogsResponse200LogsItemLevel,
+    )
+    from .get_api_sessions_id_messages_response_200 import (
+        GetApiSessionsIdMessagesResponse200,
+    )
+    from .get_api_sessions_id_response_200 import GetApiSessionsIdResponse200
+    from .get_api_sessions_response_200 import GetApiSessionsResponse200
+    from .get_api_usage_response_200 import GetApiUsageResponse200
+    from .get_api_usage_stats_response_200 import GetApiUsageStatsResponse200
+    from .health_response import HealthResponse
+    from .health_response_status import HealthResponseStatus
+    from .message import Message
+    from .message_role import MessageRole
+    from .patch_api_sessions_id_config_body import PatchApiSessionsIdConfigBody
+    from .patch_api_sessions_id_config_body_subagents import (
+        PatchApiSessionsIdConfigBodySubagents,
+    )
+    from .patch_api_sessions_id_config_response_200 import (
+        PatchApiSessionsIdConfigResponse200,
+    )
+    from .pool_stats import PoolStats
+    from .post_api_agents_body import PostApiAgentsBody
+    from .post_api_agents_body_files_item import PostApiAgentsBodyFilesItem
+    from .post_api_agents_response_201 import PostApiAgentsResponse201
+    from .post_api_credentials_body import PostApiCredentialsBody
+    from .post_api_credentials_body_type import PostApiCredentialsBodyType
+    from .post_api_credentials_response_201 import PostApiCredentialsResponse201
+    from .post_api_credentials_response_201_credential import (
+        PostApiCredentialsResponse201Credential,
+    )
+    from .post_api_queue_body import PostApiQueueBody
+    from .post_api_queue_response_201 import PostApiQueueResponse201
+    from .post_api_sessions_body import PostApiSessionsBody
+    from .post_api_sessions_body_extra_env import PostApiSessionsBodyExtraEnv
+    from .post_api_sessions_body_mcp_servers import PostApiSessionsBodyMcpServers
+    from .post_api_sessions_body_mcp_servers_additional_property import (
+        PostApiSessionsBodyMcpServersAdditionalProperty,
+    )
+    from .post_api_sessions_body_mcp_servers_additional_property_env import (
+        PostApiSessionsBodyMcpServersAdditionalPropertyEnv,
+    )
+    from .post_api_sessions_body_permission_mode import (
+        PostApiSessionsBodyPermissionMode,
+    )
+    from .post_api_sessions_body_subagents import PostApiSessionsBodySubagents
+    from .post_api_sessions_id_attachments_body import PostApiSessionsIdAttachmentsBody
+    from .post_api_sessions_id_attachments_response_201 import (
+        PostApiSessionsIdAttachmentsResponse201,
+    )
+    from .post_api_sessions_id_exec_body import PostApiSessionsIdExecBody
+    from .post_api_sessions_id_exec_response_200 import PostApiSessionsIdExecResponse200
+    from .post_api_sessions_id_files_body import PostApiSessionsIdFilesBody
+    from .post_api_sessions_id_files_body_files_item import (
+        PostApiSessionsIdFilesBodyFilesItem,
+    )
+    from .post_api_sessions_id_fork_response_201 import PostApiSessionsIdForkResponse201
+    from .post_api_sessions_id_messages_body import PostApiSessionsIdMessagesBody
+    from .post_api_sessions_id_messages_body_effort import (
+        PostApiSessionsIdMessagesBodyEffort,
+    )
+    from .post_api_sessions_id_messages_body_output_format import (
+        PostApiSessionsIdMessagesBodyOutputFormat,
+    )
+    from .post_api_sessions_id_messages_body_output_format_schema import (
+        PostApiSessionsIdMessagesBodyOutputFormatSchema,
+    )
+    from .post_api_sessions_id_messages_body_thinking import (
+        PostApiSessionsIdMessagesBodyThinking,
+    )
+    from .post_api_sessions_id_pause_response_200 import (
+        PostApiSessionsIdPauseResponse200,
+    )
+    from .post_api_sessions_id_resume_response_200 import (
+        PostApiSessionsIdResumeResponse200,
+    )
+    from .post_api_sessions_id_stop_response_200 import PostApiSessionsIdStopResponse200
+    from .post_api_sessions_id_workspace_body import PostApiSessionsIdWorkspaceBody
+    from .post_api_sessions_id_workspace_response_200 import (
+        PostApiSessionsIdWorkspaceResponse200,
+    )
+    from .post_api_sessions_response_201 import PostApiSessionsResponse201
+    from .queue_item import QueueItem
+    from .queue_item_status import QueueItemStatus
+    from .session import Session
+    from .session_event import SessionEvent
+    from .session_event_type import SessionEventType
+    from .session_status import SessionStatus
+    from .usage_event import UsageEvent
+    from .usage_stats import UsageStats
 
 __all__ = (
     "Agent",
@@ -211,3 +229,103 @@ __all__ = (
     "UsageEvent",
     "UsageStats",
 )
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "Agent": ".agent",
+    "ApiError": ".api_error",
+    "Attachment": ".attachment",
+    "Credential": ".credential",
+    "DeleteApiAgentsNameResponse200": ".delete_api_agents_name_response_200",
+    "DeleteApiQueueIdResponse200": ".delete_api_queue_id_response_200",
+    "DeleteApiSessionsIdResponse200": ".delete_api_sessions_id_response_200",
+    "GetApiAgentsNameFilesFormat": ".get_api_agents_name_files_format",
+    "GetApiAgentsNameFilesResponse200": ".get_api_agents_name_files_response_200",
+    "GetApiAgentsNameFilesResponse200FilesItem": ".get_api_agents_name_files_response_200_files_item",
+    "GetApiAgentsNameResponse200": ".get_api_agents_name_response_200",
+    "GetApiAgentsResponse200": ".get_api_agents_response_200",
+    "GetApiCredentialsResponse200": ".get_api_credentials_response_200",
+    "GetApiCredentialsResponse200CredentialsItem": ".get_api_credentials_response_200_credentials_item",
+    "GetApiQueueIdResponse200": ".get_api_queue_id_response_200",
+    "GetApiQueueResponse200": ".get_api_queue_response_200",
+    "GetApiQueueStatsResponse200": ".get_api_queue_stats_response_200",
+    "GetApiQueueStatsResponse200Stats": ".get_api_queue_stats_response_200_stats",
+    "GetApiQueueStatus": ".get_api_queue_status",
+    "GetApiSessionsIdAttachmentsResponse200": ".get_api_sessions_id_attachments_response_200",
+    "GetApiSessionsIdEventsResponse200": ".get_api_sessions_id_events_response_200",
+    "GetApiSessionsIdFilesFormat": ".get_api_sessions_id_files_format",
+    "GetApiSessionsIdFilesIncludeHidden": ".get_api_sessions_id_files_include_hidden",
+    "GetApiSessionsIdFilesResponse200": ".get_api_sessions_id_files_response_200",
+    "GetApiSessionsIdFilesResponse200FilesItem": ".get_api_sessions_id_files_response_200_files_item",
+    "GetApiSessionsIdFilesResponse200Source": ".get_api_sessions_id_files_response_200_source",
+    "GetApiSessionsIdLogsResponse200": ".get_api_sessions_id_logs_response_200",
+    "GetApiSessionsIdLogsResponse200LogsItem": ".get_api_sessions_id_logs_response_200_logs_item",
+    "GetApiSessionsIdLogsResponse200LogsItemLevel": ".get_api_sessions_id_logs_response_200_logs_item_level",
+    "GetApiSessionsIdMessagesResponse200": ".get_api_sessions_id_messages_response_200",
+    "GetApiSessionsIdResponse200": ".get_api_sessions_id_response_200",
+    "GetApiSessionsResponse200": ".get_api_sessions_response_200",
+    "GetApiUsageResponse200": ".get_api_usage_response_200",
+    "GetApiUsageStatsResponse200": ".get_api_usage_stats_response_200",
+    "HealthResponse": ".health_response",
+    "HealthResponseStatus": ".health_response_status",
+    "Message": ".message",
+    "MessageRole": ".message_role",
+    "PatchApiSessionsIdConfigBody": ".patch_api_sessions_id_config_body",
+    "PatchApiSessionsIdConfigBodySubagents": ".patch_api_sessions_id_config_body_subagents",
+    "PatchApiSessionsIdConfigResponse200": ".patch_api_sessions_id_config_response_200",
+    "PoolStats": ".pool_stats",
+    "PostApiAgentsBody": ".post_api_agents_body",
+    "PostApiAgentsBodyFilesItem": ".post_api_agents_body_files_item",
+    "PostApiAgentsResponse201": ".post_api_agents_response_201",
+    "PostApiCredentialsBody": ".post_api_credentials_body",
+    "PostApiCredentialsBodyType": ".post_api_credentials_body_type",
+    "PostApiCredentialsResponse201": ".post_api_credentials_response_201",
+    "PostApiCredentialsResponse201Credential": ".post_api_credentials_response_201_credential",
+    "PostApiQueueBody": ".post_api_queue_body",
+    "PostApiQueueResponse201": ".post_api_queue_response_201",
+    "PostApiSessionsBody": ".post_api_sessions_body",
+    "PostApiSessionsBodyExtraEnv": ".post_api_sessions_body_extra_env",
+    "PostApiSessionsBodyMcpServers": ".post_api_sessions_body_mcp_servers",
+    "PostApiSessionsBodyMcpServersAdditionalProperty": ".post_api_sessions_body_mcp_servers_additional_property",
+    "PostApiSessionsBodyMcpServersAdditionalPropertyEnv": ".post_api_sessions_body_mcp_servers_additional_property_env",
+    "PostApiSessionsBodyPermissionMode": ".post_api_sessions_body_permission_mode",
+    "PostApiSessionsBodySubagents": ".post_api_sessions_body_subagents",
+    "PostApiSessionsIdAttachmentsBody": ".post_api_sessions_id_attachments_body",
+    "PostApiSessionsIdAttachmentsResponse201": ".post_api_sessions_id_attachments_response_201",
+    "PostApiSessionsIdExecBody": ".post_api_sessions_id_exec_body",
+    "PostApiSessionsIdExecResponse200": ".post_api_sessions_id_exec_response_200",
+    "PostApiSessionsIdFilesBody": ".post_api_sessions_id_files_body",
+    "PostApiSessionsIdFilesBodyFilesItem": ".post_api_sessions_id_files_body_files_item",
+    "PostApiSessionsIdForkResponse201": ".post_api_sessions_id_fork_response_201",
+    "PostApiSessionsIdMessagesBody": ".post_api_sessions_id_messages_body",
+    "PostApiSessionsIdMessagesBodyEffort": ".post_api_sessions_id_messages_body_effort",
+    "PostApiSessionsIdMessagesBodyOutputFormat": ".post_api_sessions_id_messages_body_output_format",
+    "PostApiSessionsIdMessagesBodyOutputFormatSchema": ".post_api_sessions_id_messages_body_output_format_schema",
+    "PostApiSessionsIdMessagesBodyThinking": ".post_api_sessions_id_messages_body_thinking",
+    "PostApiSessionsIdPauseResponse200": ".post_api_sessions_id_pause_response_200",
+    "PostApiSessionsIdResumeResponse200": ".post_api_sessions_id_resume_response_200",
+    "PostApiSessionsIdStopResponse200": ".post_api_sessions_id_stop_response_200",
+    "PostApiSessionsIdWorkspaceBody": ".post_api_sessions_id_workspace_body",
+    "PostApiSessionsIdWorkspaceResponse200": ".post_api_sessions_id_workspace_response_200",
+    "PostApiSessionsResponse201": ".post_api_sessions_response_201",
+    "QueueItem": ".queue_item",
+    "QueueItemStatus": ".queue_item_status",
+    "Session": ".session",
+    "SessionEvent": ".session_event",
+    "SessionEventType": ".session_event_type",
+    "SessionStatus": ".session_status",
+    "UsageEvent": ".usage_event",
+    "UsageStats": ".usage_stats",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
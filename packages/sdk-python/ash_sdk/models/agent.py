@@ -1,21 +1,33 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_datetime
 
 T = TypeVar("T", bound="Agent")
 
-
-@_attrs_define
-class Agent:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "id",
+        "name",
+        "version",
+        "path",
+        "createdAt",
+        "updatedAt",
+        "tenantId",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class Agent(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         id (UUID):
@@ -34,82 +46,45 @@ class Agent:
     created_at: datetime.datetime
     updated_at: datetime.datetime
     tenant_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        id = str(self.id)
-
-        name = self.name
-
-        version = self.version
-
-        path = self.path
-
-        created_at = self.created_at.isoformat()
-
-        updated_at = self.updated_at.isoformat()
-
-        tenant_id = self.tenant_id
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "name": name,
-                "version": version,
-                "path": path,
-                "createdAt": created_at,
-                "updatedAt": updated_at,
-            }
-        )
-        if tenant_id is not UNSET:
-            field_dict["tenantId"] = tenant_id
+        field_dict: dict[str, Any] = {
+            "id": str(self.id),
+            "name": self.name,
+            "version": self.version,
+            "path": self.path,
+            "createdAt": self.created_at.isoformat(),
+            "updatedAt": self.updated_at.isoformat(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.tenant_id is not UNSET:
+            field_dict["tenantId"] = self.tenant_id
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
-
-        name = d.pop("name")
-
-        version = d.pop("version")
-
-        path = d.pop("path")
-
-        created_at = isoparse(d.pop("createdAt"))
-
-        updated_at = isoparse(d.pop("updatedAt"))
-
-        tenant_id = d.pop("tenantId", UNSET)
-
         agent = cls(
-            id=id,
-            name=name,
-            version=version,
-            path=path,
-            created_at=created_at,
-            updated_at=updated_at,
-            tenant_id=tenant_id,
+            UUID(src_dict["id"]),
+            src_dict["name"],
+            src_dict["version"],
+            src_dict["path"],
+            parse_datetime(src_dict["createdAt"]),
+            parse_datetime(src_dict["updatedAt"]),
+            src_dict.get("tenantId", UNSET),
         )
 
-        agent.additional_properties = d
+        if len(src_dict) > 6:
+            agent._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return agent
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,21 +1,34 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_datetime, parse_uuid
 
 T = TypeVar("T", bound="Attachment")
 
-
-@_attrs_define
-class Attachment:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "id",
+        "sessionId",
+        "filename",
+        "mimeType",
+        "size",
+        "createdAt",
+        "tenantId",
+        "messageId",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class Attachment(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         id (UUID):
@@ -36,89 +49,48 @@ class Attachment:
     created_at: datetime.datetime
     tenant_id: str | Unset = UNSET
     message_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        id = str(self.id)
-
-        session_id = str(self.session_id)
-
-        filename = self.filename
-
-        mime_type = self.mime_type
-
-        size = self.size
-
-        created_at = self.created_at.isoformat()
-
-        tenant_id = self.tenant_id
-
-        message_id = self.message_id
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "sessionId": session_id,
-                "filename": filename,
-                "mimeType": mime_type,
-                "size": size,
-                "createdAt": created_at,
-            }
-        )
-        if tenant_id is not UNSET:
-            field_dict["tenantId"] = tenant_id
-        if message_id is not UNSET:
-            field_dict["messageId"] = message_id
+        field_dict: dict[str, Any] = {
+            "id": str(self.id),
+            "sessionId": str(self.session_id),
+            "filename": self.filename,
+            "mimeType": self.mime_type,
+            "size": self.size,
+            "createdAt": self.created_at.isoformat(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.tenant_id is not UNSET:
+            field_dict["tenantId"] = self.tenant_id
+        if self.message_id is not UNSET:
+            field_dict["messageId"] = self.message_id
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
-
-        session_id = UUID(d.pop("sessionId"))
-
-        filename = d.pop("filename")
-
-        mime_type = d.pop("mimeType")
-
-        size = d.pop("size")
-
-        created_at = isoparse(d.pop("createdAt"))
-
-        tenant_id = d.pop("tenantId", UNSET)
-
-        message_id = d.pop("messageId", UNSET)
-
         attachment = cls(
-            id=id,
-            session_id=session_id,
-            filename=filename,
-            mime_type=mime_type,
-            size=size,
-            created_at=created_at,
-            tenant_id=tenant_id,
-            message_id=message_id,
+            UUID(src_dict["id"]),
+            parse_uuid(src_dict["sessionId"]),
+            src_dict["filename"],
+            src_dict["mimeType"],
+            src_dict["size"],
+            parse_datetime(src_dict["createdAt"]),
+            src_dict.get("tenantId", UNSET),
+            src_dict.get("messageId", UNSET),
         )
 
-        attachment.additional_properties = d
+        if len(src_dict) > 6:
+            attachment._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return attachment
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,21 +1,33 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from collections.abc import Iterable, Mapping
+from sys import intern
+from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_datetime
 
 T = TypeVar("T", bound="Credential")
 
-
-@_attrs_define
-class Credential:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "id",
+        "type",
+        "createdAt",
+        "tenantId",
+        "label",
+        "lastUsedAt",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class Credential(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         id (UUID):
@@ -32,44 +44,31 @@ class Credential:
     tenant_id: str | Unset = UNSET
     label: None | str | Unset = UNSET
     last_used_at: datetime.datetime | None | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        id = str(self.id)
-
-        type_ = self.type_
-
-        created_at = self.created_at.isoformat()
-
-        tenant_id = self.tenant_id
-
-        label: None | str | Unset
-        if isinstance(self.label, Unset):
-            label = UNSET
-        else:
-            label = self.label
-
         last_used_at: None | str | Unset
-        if isinstance(self.last_used_at, Unset):
+        if self.last_used_at is UNSET:
             last_used_at = UNSET
         elif isinstance(self.last_used_at, datetime.datetime):
             last_used_at = self.last_used_at.isoformat()
         else:
             last_used_at = self.last_used_at
 
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "type": type_,
-                "createdAt": created_at,
-            }
-        )
-        if tenant_id is not UNSET:
-            field_dict["tenantId"] = tenant_id
-        if label is not UNSET:
-            field_dict["label"] = label
+        field_dict: dict[str, Any] = {
+            "id": str(self.id),
+            "type": self.type_,
+            "createdAt": self.created_at.isoformat(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.tenant_id is not UNSET:
+            field_dict["tenantId"] = self.tenant_id
+        if self.label is not UNSET:
+            field_dict["label"] = self.label
         if last_used_at is not UNSET:
             field_dict["lastUsedAt"] = last_used_at
 
@@ -77,65 +76,28 @@ class Credential:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
-
-        type_ = d.pop("type")
-
-        created_at = isoparse(d.pop("createdAt"))
-
-        tenant_id = d.pop("tenantId", UNSET)
-
-        def _parse_label(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        label = _parse_label(d.pop("label", UNSET))
-
-        def _parse_last_used_at(data: object) -> datetime.datetime | None | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
+        last_used_at = src_dict.get("lastUsedAt", UNSET)
+        if isinstance(last_used_at, str):
             try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                last_used_at_type_0 = isoparse(data)
-
-                return last_used_at_type_0
+                last_used_at = parse_datetime(last_used_at)
             except (TypeError, ValueError, AttributeError, KeyError):
                 pass
-            return cast(datetime.datetime | None | Unset, data)
-
-        last_used_at = _parse_last_used_at(d.pop("lastUsedAt", UNSET))
 
         credential = cls(
-            id=id,
-            type_=type_,
-            created_at=created_at,
-            tenant_id=tenant_id,
-            label=label,
-            last_used_at=last_used_at,
+            UUID(src_dict["id"]),
+            intern(src_dict["type"]),
+            parse_datetime(src_dict["createdAt"]),
+            src_dict.get("tenantId", UNSET),
+            src_dict.get("label", UNSET),
+            last_used_at,
         )
 
-        credential.additional_properties = d
+        if len(src_dict) > 3:
+            credential._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return credential
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
 
 T = TypeVar("T", bound="DeleteApiAgentsNameResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class DeleteApiAgentsNameResponse200:
     """
     Attributes:
@@ -17,45 +16,24 @@ class DeleteApiAgentsNameResponse200:
     """
 
     ok: bool
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        ok = self.ok
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "ok": ok,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "ok": self.ok,
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        ok = d.pop("ok")
-
         delete_api_agents_name_response_200 = cls(
-            ok=ok,
+            src_dict["ok"],
         )
 
-        delete_api_agents_name_response_200.additional_properties = d
         return delete_api_agents_name_response_200
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,14 +1,21 @@
-from typing import Literal, cast
+from typing import Literal
 
 GetApiAgentsNameFilesFormat = Literal["json", "raw"]
 
-GET_API_AGENTS_NAME_FILES_FORMAT_VALUES: set[GetApiAgentsNameFilesFormat] = {
-    "json",
-    "raw",
-}
+GET_API_AGENTS_NAME_FILES_FORMAT_VALUES: frozenset[GetApiAgentsNameFilesFormat] = frozenset(
+    {
+        "json",
+        "raw",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, GetApiAgentsNameFilesFormat] = {value: value for value in GET_API_AGENTS_NAME_FILES_FORMAT_VALUES}
 
 
 def check_get_api_agents_name_files_format(value: str) -> GetApiAgentsNameFilesFormat:
-    if value in GET_API_AGENTS_NAME_FILES_FORMAT_VALUES:
-        return cast(GetApiAgentsNameFilesFormat, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {GET_API_AGENTS_NAME_FILES_FORMAT_VALUES!r}")
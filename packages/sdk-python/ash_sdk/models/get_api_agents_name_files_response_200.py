@@ -1,21 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
-
-if TYPE_CHECKING:
-    from ..models.get_api_agents_name_files_response_200_files_item import (
-        GetApiAgentsNameFilesResponse200FilesItem,
-    )
-
 
 T = TypeVar("T", bound="GetApiAgentsNameFilesResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiAgentsNameFilesResponse200:
     """
     Attributes:
@@ -23,57 +16,31 @@ class GetApiAgentsNameFilesResponse200:
     """
 
     files: list[GetApiAgentsNameFilesResponse200FilesItem]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        files = []
-        for files_item_data in self.files:
-            files_item = files_item_data.to_dict()
-            files.append(files_item)
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "files": files,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "files": [files_item_data.to_dict() for files_item_data in self.files],
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.get_api_agents_name_files_response_200_files_item import (
-            GetApiAgentsNameFilesResponse200FilesItem,
-        )
-
-        d = dict(src_dict)
-        files = []
-        _files = d.pop("files")
-        for files_item_data in _files:
-            files_item = GetApiAgentsNameFilesResponse200FilesItem.from_dict(files_item_data)
-
-            files.append(files_item)
-
         get_api_agents_name_files_response_200 = cls(
-            files=files,
+            GetApiAgentsNameFilesResponse200FilesItem.batch_from_dict(src_dict["files"]),
         )
 
-        get_api_agents_name_files_response_200.additional_properties = d
         return get_api_agents_name_files_response_200
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.get_api_agents_name_files_response_200_files_item import (
+    GetApiAgentsNameFilesResponse200FilesItem,
+)
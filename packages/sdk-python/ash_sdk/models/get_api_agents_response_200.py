@@ -1,19 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
-
-if TYPE_CHECKING:
-    from ..models.agent import Agent
-
 
 T = TypeVar("T", bound="GetApiAgentsResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiAgentsResponse200:
     """
     Attributes:
@@ -21,55 +16,29 @@ class GetApiAgentsResponse200:
     """
 
     agents: list[Agent]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        agents = []
-        for agents_item_data in self.agents:
-            agents_item = agents_item_data.to_dict()
-            agents.append(agents_item)
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "agents": agents,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "agents": [agents_item_data.to_dict() for agents_item_data in self.agents],
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.agent import Agent
-
-        d = dict(src_dict)
-        agents = []
-        _agents = d.pop("agents")
-        for agents_item_data in _agents:
-            agents_item = Agent.from_dict(agents_item_data)
-
-            agents.append(agents_item)
-
         get_api_agents_response_200 = cls(
-            agents=agents,
+            Agent.batch_from_dict(src_dict["agents"]),
         )
 
-        get_api_agents_response_200.additional_properties = d
         return get_api_agents_response_200
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.agent import Agent
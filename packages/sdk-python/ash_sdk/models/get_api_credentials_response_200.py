@@ -1,23 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.get_api_credentials_response_200_credentials_item import (
-        GetApiCredentialsResponse200CredentialsItem,
-    )
-
-
 T = TypeVar("T", bound="GetApiCredentialsResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiCredentialsResponse200:
     """
     Attributes:
@@ -25,59 +18,37 @@ class GetApiCredentialsResponse200:
     """
 
     credentials: list[GetApiCredentialsResponse200CredentialsItem] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        credentials: list[dict[str, Any]] | Unset = UNSET
-        if not isinstance(self.credentials, Unset):
-            credentials = []
-            for credentials_item_data in self.credentials:
-                credentials_item = credentials_item_data.to_dict()
-                credentials.append(credentials_item)
-
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if credentials is not UNSET:
-            field_dict["credentials"] = credentials
+
+        if self.credentials is not UNSET:
+            field_dict["credentials"] = [credentials_item_data.to_dict() for credentials_item_data in self.credentials]
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.get_api_credentials_response_200_credentials_item import (
-            GetApiCredentialsResponse200CredentialsItem,
-        )
-
-        d = dict(src_dict)
-        _credentials = d.pop("credentials", UNSET)
+        _credentials = src_dict.get("credentials", UNSET)
         credentials: list[GetApiCredentialsResponse200CredentialsItem] | Unset = UNSET
         if _credentials is not UNSET:
-            credentials = []
-            for credentials_item_data in _credentials:
-                credentials_item = GetApiCredentialsResponse200CredentialsItem.from_dict(credentials_item_data)
-
-                credentials.append(credentials_item)
+            credentials = GetApiCredentialsResponse200CredentialsItem.batch_from_dict(_credentials)
 
         get_api_credentials_response_200 = cls(
-            credentials=credentials,
+            credentials,
         )
 
-        get_api_credentials_response_200.additional_properties = d
         return get_api_credentials_response_200
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.get_api_credentials_response_200_credentials_item import (
+    GetApiCredentialsResponse200CredentialsItem,
+)
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from collections.abc import Iterable, Mapping
+from sys import intern
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="GetApiCredentialsResponse200CredentialsItem")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiCredentialsResponse200CredentialsItem:
     """
     Attributes:
@@ -29,89 +29,44 @@ class GetApiCredentialsResponse200CredentialsItem:
     active: bool | Unset = UNSET
     created_at: str | Unset = UNSET
     last_used_at: None | str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        id = self.id
-
-        type_ = self.type_
-
-        label = self.label
-
-        active = self.active
-
-        created_at = self.created_at
-
-        last_used_at: None | str | Unset
-        if isinstance(self.last_used_at, Unset):
-            last_used_at = UNSET
-        else:
-            last_used_at = self.last_used_at
-
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if id is not UNSET:
-            field_dict["id"] = id
-        if type_ is not UNSET:
-            field_dict["type"] = type_
-        if label is not UNSET:
-            field_dict["label"] = label
-        if active is not UNSET:
-            field_dict["active"] = active
-        if created_at is not UNSET:
-            field_dict["createdAt"] = created_at
-        if last_used_at is not UNSET:
-            field_dict["lastUsedAt"] = last_used_at
+
+        if self.id is not UNSET:
+            field_dict["id"] = self.id
+        if self.type_ is not UNSET:
+            field_dict["type"] = self.type_
+        if self.label is not UNSET:
+            field_dict["label"] = self.label
+        if self.active is not UNSET:
+            field_dict["active"] = self.active
+        if self.created_at is not UNSET:
+            field_dict["createdAt"] = self.created_at
+        if self.last_used_at is not UNSET:
+            field_dict["lastUsedAt"] = self.last_used_at
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = d.pop("id", UNSET)
-
-        type_ = d.pop("type", UNSET)
-
-        label = d.pop("label", UNSET)
-
-        active = d.pop("active", UNSET)
-
-        created_at = d.pop("createdAt", UNSET)
-
-        def _parse_last_used_at(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        last_used_at = _parse_last_used_at(d.pop("lastUsedAt", UNSET))
+        type_ = src_dict.get("type", UNSET)
+        if type_ is not UNSET:
+            type_ = intern(type_)
 
         get_api_credentials_response_200_credentials_item = cls(
-            id=id,
-            type_=type_,
-            label=label,
-            active=active,
-            created_at=created_at,
-            last_used_at=last_used_at,
+            src_dict.get("id", UNSET),
+            type_,
+            src_dict.get("label", UNSET),
+            src_dict.get("active", UNSET),
+            src_dict.get("createdAt", UNSET),
+            src_dict.get("lastUsedAt", UNSET),
         )
 
-        get_api_credentials_response_200_credentials_item.additional_properties = d
         return get_api_credentials_response_200_credentials_item
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
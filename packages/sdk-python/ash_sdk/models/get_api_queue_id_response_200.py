@@ -1,19 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
-
-if TYPE_CHECKING:
-    from ..models.queue_item import QueueItem
-
 
 T = TypeVar("T", bound="GetApiQueueIdResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiQueueIdResponse200:
     """
     Attributes:
@@ -21,47 +16,29 @@ class GetApiQueueIdResponse200:
     """
 
     item: QueueItem
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        item = self.item.to_dict()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "item": item,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "item": self.item.to_dict(),
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.queue_item import QueueItem
-
-        d = dict(src_dict)
-        item = QueueItem.from_dict(d.pop("item"))
-
         get_api_queue_id_response_200 = cls(
-            item=item,
+            QueueItem.from_dict(src_dict["item"]),
         )
 
-        get_api_queue_id_response_200.additional_properties = d
         return get_api_queue_id_response_200
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.queue_item import QueueItem
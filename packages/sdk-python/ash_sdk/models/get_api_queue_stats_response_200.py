@@ -1,21 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
-
-if TYPE_CHECKING:
-    from ..models.get_api_queue_stats_response_200_stats import (
-        GetApiQueueStatsResponse200Stats,
-    )
-
 
 T = TypeVar("T", bound="GetApiQueueStatsResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiQueueStatsResponse200:
     """
     Attributes:
@@ -23,49 +16,31 @@ class GetApiQueueStatsResponse200:
     """
 
     stats: GetApiQueueStatsResponse200Stats
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        stats = self.stats.to_dict()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "stats": stats,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "stats": self.stats.to_dict(),
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.get_api_queue_stats_response_200_stats import (
-            GetApiQueueStatsResponse200Stats,
-        )
-
-        d = dict(src_dict)
-        stats = GetApiQueueStatsResponse200Stats.from_dict(d.pop("stats"))
-
         get_api_queue_stats_response_200 = cls(
-            stats=stats,
+            GetApiQueueStatsResponse200Stats.from_dict(src_dict["stats"]),
         )
 
-        get_api_queue_stats_response_200.additional_properties = d
         return get_api_queue_stats_response_200
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.get_api_queue_stats_response_200_stats import (
+    GetApiQueueStatsResponse200Stats,
+)
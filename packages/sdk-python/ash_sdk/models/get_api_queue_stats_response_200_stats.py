@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
 
 T = TypeVar("T", bound="GetApiQueueStatsResponse200Stats")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiQueueStatsResponse200Stats:
     """
     Attributes:
@@ -25,69 +24,32 @@ class GetApiQueueStatsResponse200Stats:
     completed: int
     failed: int
     cancelled: int
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        pending = self.pending
-
-        processing = self.processing
-
-        completed = self.completed
-
-        failed = self.failed
-
-        cancelled = self.cancelled
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "pending": pending,
-                "processing": processing,
-                "completed": completed,
-                "failed": failed,
-                "cancelled": cancelled,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "pending": self.pending,
+            "processing": self.processing,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        pending = d.pop("pending")
-
-        processing = d.pop("processing")
-
-        completed = d.pop("completed")
-
-        failed = d.pop("failed")
-
-        cancelled = d.pop("cancelled")
-
         get_api_queue_stats_response_200_stats = cls(
-            pending=pending,
-            processing=processing,
-            completed=completed,
-            failed=failed,
-            cancelled=cancelled,
+            src_dict["pending"],
+            src_dict["processing"],
+            src_dict["completed"],
+            src_dict["failed"],
+            src_dict["cancelled"],
         )
 
-        get_api_queue_stats_response_200_stats.additional_properties = d
         return get_api_queue_stats_response_200_stats
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
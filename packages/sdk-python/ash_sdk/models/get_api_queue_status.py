@@ -1,17 +1,24 @@
-from typing import Literal, cast
+from typing import Literal
 
 GetApiQueueStatus = Literal["cancelled", "completed", "failed", "pending", "processing"]
 
-GET_API_QUEUE_STATUS_VALUES: set[GetApiQueueStatus] = {
-    "cancelled",
-    "completed",
-    "failed",
-    "pending",
-    "processing",
-}
+GET_API_QUEUE_STATUS_VALUES: frozenset[GetApiQueueStatus] = frozenset(
+    {
+        "cancelled",
+        "completed",
+        "failed",
+        "pending",
+        "processing",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, GetApiQueueStatus] = {value: value for value in GET_API_QUEUE_STATUS_VALUES}
 
 
 def check_get_api_queue_status(value: str) -> GetApiQueueStatus:
-    if value in GET_API_QUEUE_STATUS_VALUES:
-        return cast(GetApiQueueStatus, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {GET_API_QUEUE_STATUS_VALUES!r}")
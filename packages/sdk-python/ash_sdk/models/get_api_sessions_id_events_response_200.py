@@ -1,19 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
-
-if TYPE_CHECKING:
-    from ..models.session_event import SessionEvent
-
 
 T = TypeVar("T", bound="GetApiSessionsIdEventsResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiSessionsIdEventsResponse200:
     """
     Attributes:
@@ -21,55 +16,29 @@ class GetApiSessionsIdEventsResponse200:
     """
 
     events: list[SessionEvent]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        events = []
-        for events_item_data in self.events:
-            events_item = events_item_data.to_dict()
-            events.append(events_item)
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "events": events,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "events": [events_item_data.to_dict() for events_item_data in self.events],
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.session_event import SessionEvent
-
-        d = dict(src_dict)
-        events = []
-        _events = d.pop("events")
-        for events_item_data in _events:
-            events_item = SessionEvent.from_dict(events_item_data)
-
-            events.append(events_item)
-
         get_api_sessions_id_events_response_200 = cls(
-            events=events,
+            SessionEvent.batch_from_dict(src_dict["events"]),
         )
 
-        get_api_sessions_id_events_response_200.additional_properties = d
         return get_api_sessions_id_events_response_200
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.session_event import SessionEvent
@@ -1,14 +1,21 @@
-from typing import Literal, cast
+from typing import Literal
 
 GetApiSessionsIdFilesFormat = Literal["json", "raw"]
 
-GET_API_SESSIONS_ID_FILES_FORMAT_VALUES: set[GetApiSessionsIdFilesFormat] = {
-    "json",
-    "raw",
-}
+GET_API_SESSIONS_ID_FILES_FORMAT_VALUES: frozenset[GetApiSessionsIdFilesFormat] = frozenset(
+    {
+        "json",
+        "raw",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, GetApiSessionsIdFilesFormat] = {value: value for value in GET_API_SESSIONS_ID_FILES_FORMAT_VALUES}
 
 
 def check_get_api_sessions_id_files_format(value: str) -> GetApiSessionsIdFilesFormat:
-    if value in GET_API_SESSIONS_ID_FILES_FORMAT_VALUES:
-        return cast(GetApiSessionsIdFilesFormat, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {GET_API_SESSIONS_ID_FILES_FORMAT_VALUES!r}")
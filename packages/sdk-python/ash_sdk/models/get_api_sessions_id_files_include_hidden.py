@@ -1,16 +1,25 @@
-from typing import Literal, cast
+from typing import Literal
 
 GetApiSessionsIdFilesIncludeHidden = Literal["false", "true"]
 
-GET_API_SESSIONS_ID_FILES_INCLUDE_HIDDEN_VALUES: set[GetApiSessionsIdFilesIncludeHidden] = {
-    "false",
-    "true",
+GET_API_SESSIONS_ID_FILES_INCLUDE_HIDDEN_VALUES: frozenset[GetApiSessionsIdFilesIncludeHidden] = frozenset(
+    {
+        "false",
+        "true",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, GetApiSessionsIdFilesIncludeHidden] = {
+    value: value for value in GET_API_SESSIONS_ID_FILES_INCLUDE_HIDDEN_VALUES
 }
 
 
 def check_get_api_sessions_id_files_include_hidden(
     value: str,
 ) -> GetApiSessionsIdFilesIncludeHidden:
-    if value in GET_API_SESSIONS_ID_FILES_INCLUDE_HIDDEN_VALUES:
-        return cast(GetApiSessionsIdFilesIncludeHidden, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {GET_API_SESSIONS_ID_FILES_INCLUDE_HIDDEN_VALUES!r}")
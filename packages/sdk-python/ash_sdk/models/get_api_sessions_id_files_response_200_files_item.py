@@ -1,17 +1,17 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
-from dateutil.parser import isoparse
+
+from ..types import parse_datetime
 
 T = TypeVar("T", bound="GetApiSessionsIdFilesResponse200FilesItem")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiSessionsIdFilesResponse200FilesItem:
     """
     Attributes:
@@ -23,57 +23,28 @@ class GetApiSessionsIdFilesResponse200FilesItem:
     path: str
     size: int
     modified_at: datetime.datetime
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        path = self.path
-
-        size = self.size
-
-        modified_at = self.modified_at.isoformat()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "path": path,
-                "size": size,
-                "modifiedAt": modified_at,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "path": self.path,
+            "size": self.size,
+            "modifiedAt": self.modified_at.isoformat(),
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        path = d.pop("path")
-
-        size = d.pop("size")
-
-        modified_at = isoparse(d.pop("modifiedAt"))
-
         get_api_sessions_id_files_response_200_files_item = cls(
-            path=path,
-            size=size,
-            modified_at=modified_at,
+            src_dict["path"],
+            src_dict["size"],
+            parse_datetime(src_dict["modifiedAt"]),
         )
 
-        get_api_sessions_id_files_response_200_files_item.additional_properties = d
         return get_api_sessions_id_files_response_200_files_item
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,18 +1,27 @@
-from typing import Literal, cast
+from typing import Literal
 
 GetApiSessionsIdFilesResponse200Source = Literal["sandbox", "snapshot"]
 
-GET_API_SESSIONS_ID_FILES_RESPONSE_200_SOURCE_VALUES: set[GetApiSessionsIdFilesResponse200Source] = {
-    "sandbox",
-    "snapshot",
+GET_API_SESSIONS_ID_FILES_RESPONSE_200_SOURCE_VALUES: frozenset[GetApiSessionsIdFilesResponse200Source] = frozenset(
+    {
+        "sandbox",
+        "snapshot",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, GetApiSessionsIdFilesResponse200Source] = {
+    value: value for value in GET_API_SESSIONS_ID_FILES_RESPONSE_200_SOURCE_VALUES
 }
 
 
 def check_get_api_sessions_id_files_response_200_source(
     value: str,
 ) -> GetApiSessionsIdFilesResponse200Source:
-    if value in GET_API_SESSIONS_ID_FILES_RESPONSE_200_SOURCE_VALUES:
-        return cast(GetApiSessionsIdFilesResponse200Source, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(
         f"Unexpected value {value!r}. Expected one of {GET_API_SESSIONS_ID_FILES_RESPONSE_200_SOURCE_VALUES!r}"
     )
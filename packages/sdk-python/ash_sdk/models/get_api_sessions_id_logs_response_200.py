@@ -1,21 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
-
-if TYPE_CHECKING:
-    from ..models.get_api_sessions_id_logs_response_200_logs_item import (
-        GetApiSessionsIdLogsResponse200LogsItem,
-    )
-
 
 T = TypeVar("T", bound="GetApiSessionsIdLogsResponse200")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiSessionsIdLogsResponse200:
     """
     Attributes:
@@ -25,63 +18,33 @@ class GetApiSessionsIdLogsResponse200:
 
     logs: list[GetApiSessionsIdLogsResponse200LogsItem]
     source: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        logs = []
-        for logs_item_data in self.logs:
-            logs_item = logs_item_data.to_dict()
-            logs.append(logs_item)
-
-        source = self.source
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "logs": logs,
-                "source": source,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "logs": [logs_item_data.to_dict() for logs_item_data in self.logs],
+            "source": self.source,
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.get_api_sessions_id_logs_response_200_logs_item import (
-            GetApiSessionsIdLogsResponse200LogsItem,
-        )
-
-        d = dict(src_dict)
-        logs = []
-        _logs = d.pop("logs")
-        for logs_item_data in _logs:
-            logs_item = GetApiSessionsIdLogsResponse200LogsItem.from_dict(logs_item_data)
-
-            logs.append(logs_item)
-
-        source = d.pop("source")
-
         get_api_sessions_id_logs_response_200 = cls(
-            logs=logs,
-            source=source,
+            GetApiSessionsIdLogsResponse200LogsItem.batch_from_dict(src_dict["logs"]),
+            src_dict["source"],
         )
 
-        get_api_sessions_id_logs_response_200.additional_properties = d
         return get_api_sessions_id_logs_response_200
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.get_api_sessions_id_logs_response_200_logs_item import (
+    GetApiSessionsIdLogsResponse200LogsItem,
+)
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
 
 from ..models.get_api_sessions_id_logs_response_200_logs_item_level import (
     GetApiSessionsIdLogsResponse200LogsItemLevel,
@@ -14,7 +13,7 @@ from ..models.get_api_sessions_id_logs_response_200_logs_item_level import (
 T = TypeVar("T", bound="GetApiSessionsIdLogsResponse200LogsItem")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class GetApiSessionsIdLogsResponse200LogsItem:
     """
     Attributes:
@@ -28,63 +27,30 @@ class GetApiSessionsIdLogsResponse200LogsItem:
     level: GetApiSessionsIdLogsResponse200LogsItemLevel
     text: str
     ts: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        index = self.index
-
-        level: str = self.level
-
-        text = self.text
-
-        ts = self.ts
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "index": index,
-                "level": level,
-                "text": text,
-                "ts": ts,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "index": self.index,
+            "level": self.level,
+            "text": self.text,
+            "ts": self.ts,
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        index = d.pop("index")
-
-        level = check_get_api_sessions_id_logs_response_200_logs_item_level(d.pop("level"))
-
-        text = d.pop("text")
-
-        ts = d.pop("ts")
-
         get_api_sessions_id_logs_response_200_logs_item = cls(
-            index=index,
-            level=level,
-            text=text,
-            ts=ts,
+            src_dict["index"],
+            check_get_api_sessions_id_logs_response_200_logs_item_level(src_dict["level"]),
+            src_dict["text"],
+            src_dict["ts"],
         )
 
-        get_api_sessions_id_logs_response_200_logs_item.additional_properties = d
         return get_api_sessions_id_logs_response_200_logs_item
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,19 +1,30 @@
-from typing import Literal, cast
+from typing import Literal
 
 GetApiSessionsIdLogsResponse200LogsItemLevel = Literal["stderr", "stdout", "system"]
 
-GET_API_SESSIONS_ID_LOGS_RESPONSE_200_LOGS_ITEM_LEVEL_VALUES: set[GetApiSessionsIdLogsResponse200LogsItemLevel] = {
-    "stderr",
-    "stdout",
-    "system",
+GET_API_SESSIONS_ID_LOGS_RESPONSE_200_LOGS_ITEM_LEVEL_VALUES: frozenset[
+    GetApiSessionsIdLogsResponse200LogsItemLevel
+] = frozenset(
+    {
+        "stderr",
+        "stdout",
+        "system",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, GetApiSessionsIdLogsResponse200LogsItemLevel] = {
+    value: value for value in GET_API_SESSIONS_ID_LOGS_RESPONSE_200_LOGS_ITEM_LEVEL_VALUES
 }
 
 
 def check_get_api_sessions_id_logs_response_200_logs_item_level(
     value: str,
 ) -> GetApiSessionsIdLogsResponse200LogsItemLevel:
-    if value in GET_API_SESSIONS_ID_LOGS_RESPONSE_200_LOGS_ITEM_LEVEL_VALUES:
-        return cast(GetApiSessionsIdLogsResponse200LogsItemLevel, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(
         f"Unexpected value {value!r}. Expected one of {GET_API_SESSIONS_ID_LOGS_RESPONSE_200_LOGS_ITEM_LEVEL_VALUES!r}"
     )
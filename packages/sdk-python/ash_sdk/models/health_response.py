@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
@@ -10,17 +10,27 @@ from ..models.health_response_status import (
     HealthResponseStatus,
     check_health_response_status,
 )
-from ..types import UNSET, Unset
-
-if TYPE_CHECKING:
-    from ..models.pool_stats import PoolStats
-
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="HealthResponse")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "status",
+        "activeSessions",
+        "activeSandboxes",
+        "uptime",
+        "pool",
+        "version",
+        "coordinatorId",
+        "remoteRunners",
+    )
+)
+
 
-@_attrs_define
-class HealthResponse:
+@_attrs_define(weakref_slot=False)
+class HealthResponse(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         status (HealthResponseStatus):
@@ -41,92 +51,54 @@ class HealthResponse:
     version: str | Unset = UNSET
     coordinator_id: str | Unset = UNSET
     remote_runners: int | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        status: str = self.status
-
-        active_sessions = self.active_sessions
-
-        active_sandboxes = self.active_sandboxes
-
-        uptime = self.uptime
-
-        pool = self.pool.to_dict()
-
-        version = self.version
-
-        coordinator_id = self.coordinator_id
-
-        remote_runners = self.remote_runners
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "status": status,
-                "activeSessions": active_sessions,
-                "activeSandboxes": active_sandboxes,
-                "uptime": uptime,
-                "pool": pool,
-            }
-        )
-        if version is not UNSET:
-            field_dict["version"] = version
-        if coordinator_id is not UNSET:
-            field_dict["coordinatorId"] = coordinator_id
-        if remote_runners is not UNSET:
-            field_dict["remoteRunners"] = remote_runners
+        field_dict: dict[str, Any] = {
+            "status": self.status,
+            "activeSessions": self.active_sessions,
+            "activeSandboxes": self.active_sandboxes,
+            "uptime": self.uptime,
+            "pool": self.pool.to_dict(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.version is not UNSET:
+            field_dict["version"] = self.version
+        if self.coordinator_id is not UNSET:
+            field_dict["coordinatorId"] = self.coordinator_id
+        if self.remote_runners is not UNSET:
+            field_dict["remoteRunners"] = self.remote_runners
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.pool_stats import PoolStats
-
-        d = dict(src_dict)
-        status = check_health_response_status(d.pop("status"))
-
-        active_sessions = d.pop("activeSessions")
-
-        active_sandboxes = d.pop("activeSandboxes")
-
-        uptime = d.pop("uptime")
-
-        pool = PoolStats.from_dict(d.pop("pool"))
-
-        version = d.pop("version", UNSET)
-
-        coordinator_id = d.pop("coordinatorId", UNSET)
-
-        remote_runners = d.pop("remoteRunners", UNSET)
-
         health_response = cls(
-            status=status,
-            active_sessions=active_sessions,
-            active_sandboxes=active_sandboxes,
-            uptime=uptime,
-            pool=pool,
-            version=version,
-            coordinator_id=coordinator_id,
-            remote_runners=remote_runners,
+            check_health_response_status(src_dict["status"]),
+            src_dict["activeSessions"],
+            src_dict["activeSandboxes"],
+            src_dict["uptime"],
+            PoolStats.from_dict(src_dict["pool"]),
+            src_dict.get("version", UNSET),
+            src_dict.get("coordinatorId", UNSET),
+            src_dict.get("remoteRunners", UNSET),
         )
 
-        health_response.additional_properties = d
+        if len(src_dict) > 5:
+            health_response._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return health_response
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.pool_stats import PoolStats
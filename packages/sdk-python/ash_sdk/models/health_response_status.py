@@ -1,13 +1,20 @@
-from typing import Literal, cast
+from typing import Literal
 
 HealthResponseStatus = Literal["ok"]
 
-HEALTH_RESPONSE_STATUS_VALUES: set[HealthResponseStatus] = {
-    "ok",
-}
+HEALTH_RESPONSE_STATUS_VALUES: frozenset[HealthResponseStatus] = frozenset(
+    {
+        "ok",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, HealthResponseStatus] = {value: value for value in HEALTH_RESPONSE_STATUS_VALUES}
 
 
 def check_health_response_status(value: str) -> HealthResponseStatus:
-    if value in HEALTH_RESPONSE_STATUS_VALUES:
-        return cast(HealthResponseStatus, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {HEALTH_RESPONSE_STATUS_VALUES!r}")
@@ -1,22 +1,34 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
 from ..models.message_role import MessageRole, check_message_role
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_datetime, parse_uuid
 
 T = TypeVar("T", bound="Message")
 
-
-@_attrs_define
-class Message:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "id",
+        "sessionId",
+        "role",
+        "content",
+        "sequence",
+        "createdAt",
+        "tenantId",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class Message(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         id (UUID):
@@ -35,82 +47,45 @@ class Message:
     sequence: int
     created_at: datetime.datetime
     tenant_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        id = str(self.id)
-
-        session_id = str(self.session_id)
-
-        role: str = self.role
-
-        content = self.content
-
-        sequence = self.sequence
-
-        created_at = self.created_at.isoformat()
-
-        tenant_id = self.tenant_id
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "sessionId": session_id,
-                "role": role,
-                "content": content,
-                "sequence": sequence,
-                "createdAt": created_at,
-            }
-        )
-        if tenant_id is not UNSET:
-            field_dict["tenantId"] = tenant_id
+        field_dict: dict[str, Any] = {
+            "id": str(self.id),
+            "sessionId": str(self.session_id),
+            "role": self.role,
+            "content": self.content,
+            "sequence": self.sequence,
+            "createdAt": self.created_at.isoformat(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.tenant_id is not UNSET:
+            field_dict["tenantId"] = self.tenant_id
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
-
-        session_id = UUID(d.pop("sessionId"))
-
-        role = check_message_role(d.pop("role"))
-
-        content = d.pop("content")
-
-        sequence = d.pop("sequence")
-
-        created_at = isoparse(d.pop("createdAt"))
-
-        tenant_id = d.pop("tenantId", UNSET)
-
         message = cls(
-            id=id,
-            session_id=session_id,
-            role=role,
-            content=content,
-            sequence=sequence,
-            created_at=created_at,
-            tenant_id=tenant_id,
+            UUID(src_dict["id"]),
+            parse_uuid(src_dict["sessionId"]),
+            check_message_role(src_dict["role"]),
+            src_dict["content"],
+            src_dict["sequence"],
+            parse_datetime(src_dict["createdAt"]),
+            src_dict.get("tenantId", UNSET),
         )
 
-        message.additional_properties = d
+        if len(src_dict) > 6:
+            message._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return message
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,14 +1,21 @@
-from typing import Literal, cast
+from typing import Literal
 
 MessageRole = Literal["assistant", "user"]
 
-MESSAGE_ROLE_VALUES: set[MessageRole] = {
-    "assistant",
-    "user",
-}
+MESSAGE_ROLE_VALUES: frozenset[MessageRole] = frozenset(
+    {
+        "assistant",
+        "user",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, MessageRole] = {value: value for value in MESSAGE_ROLE_VALUES}
 
 
 def check_message_role(value: str) -> MessageRole:
-    if value in MESSAGE_ROLE_VALUES:
-        return cast(MessageRole, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {MESSAGE_ROLE_VALUES!r}")
@@ -1,24 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
-
-if TYPE_CHECKING:
-    from ..models.patch_api_sessions_id_config_body_subagents import (
-        PatchApiSessionsIdConfigBodySubagents,
-    )
-
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PatchApiSessionsIdConfigBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "model",
+        "allowedTools",
+        "disallowedTools",
+        "betas",
+        "subagents",
+        "initialAgent",
+    )
+)
+
 
-@_attrs_define
-class PatchApiSessionsIdConfigBody:
+@_attrs_define(weakref_slot=False)
+class PatchApiSessionsIdConfigBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         model (str | Unset): Model override for subsequent queries.
@@ -35,95 +41,60 @@ class PatchApiSessionsIdConfigBody:
     betas: list[str] | Unset = UNSET
     subagents: PatchApiSessionsIdConfigBodySubagents | Unset = UNSET
     initial_agent: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        model = self.model
-
-        allowed_tools: list[str] | Unset = UNSET
-        if not isinstance(self.allowed_tools, Unset):
-            allowed_tools = self.allowed_tools
-
-        disallowed_tools: list[str] | Unset = UNSET
-        if not isinstance(self.disallowed_tools, Unset):
-            disallowed_tools = self.disallowed_tools
-
-        betas: list[str] | Unset = UNSET
-        if not isinstance(self.betas, Unset):
-            betas = self.betas
-
-        subagents: dict[str, Any] | Unset = UNSET
-        if not isinstance(self.subagents, Unset):
-            subagents = self.subagents.to_dict()
-
-        initial_agent = self.initial_agent
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if model is not UNSET:
-            field_dict["model"] = model
-        if allowed_tools is not UNSET:
-            field_dict["allowedTools"] = allowed_tools
-        if disallowed_tools is not UNSET:
-            field_dict["disallowedTools"] = disallowed_tools
-        if betas is not UNSET:
-            field_dict["betas"] = betas
-        if subagents is not UNSET:
-            field_dict["subagents"] = subagents
-        if initial_agent is not UNSET:
-            field_dict["initialAgent"] = initial_agent
+        field_dict: dict[str, Any] = dict(self._additional_properties) if self._additional_properties else {}
+        if self.model is not UNSET:
+            field_dict["model"] = self.model
+        if self.allowed_tools is not UNSET:
+            field_dict["allowedTools"] = self.allowed_tools
+        if self.disallowed_tools is not UNSET:
+            field_dict["disallowedTools"] = self.disallowed_tools
+        if self.betas is not UNSET:
+            field_dict["betas"] = self.betas
+        if self.subagents is not UNSET:
+            field_dict["subagents"] = self.subagents.to_dict()
+        if self.initial_agent is not UNSET:
+            field_dict["initialAgent"] = self.initial_agent
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.patch_api_sessions_id_config_body_subagents import (
-            PatchApiSessionsIdConfigBodySubagents,
-        )
-
-        d = dict(src_dict)
-        model = d.pop("model", UNSET)
-
-        allowed_tools = cast(list[str], d.pop("allowedTools", UNSET))
-
-        disallowed_tools = cast(list[str], d.pop("disallowedTools", UNSET))
-
-        betas = cast(list[str], d.pop("betas", UNSET))
-
-        _subagents = d.pop("subagents", UNSET)
+        _subagents = src_dict.get("subagents", UNSET)
         subagents: PatchApiSessionsIdConfigBodySubagents | Unset
-        if isinstance(_subagents, Unset):
+        if _subagents is UNSET:
             subagents = UNSET
         else:
             subagents = PatchApiSessionsIdConfigBodySubagents.from_dict(_subagents)
 
-        initial_agent = d.pop("initialAgent", UNSET)
-
         patch_api_sessions_id_config_body = cls(
-            model=model,
-            allowed_tools=allowed_tools,
-            disallowed_tools=disallowed_tools,
-            betas=betas,
-            subagents=subagents,
-            initial_agent=initial_agent,
+            src_dict.get("model", UNSET),
+            src_dict.get("allowedTools", UNSET),
+            src_dict.get("disallowedTools", UNSET),
+            src_dict.get("betas", UNSET),
+            subagents,
+            src_dict.get("initialAgent", UNSET),
         )
 
-        patch_api_sessions_id_config_body.additional_properties = d
+        if len(src_dict) > 0:
+            patch_api_sessions_id_config_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return patch_api_sessions_id_config_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.patch_api_sessions_id_config_body_subagents import (
+    PatchApiSessionsIdConfigBodySubagents,
+)
@@ -1,16 +1,34 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-T = TypeVar("T", bound="PoolStats")
+from ..types import AdditionalPropertiesMixin
 
+T = TypeVar("T", bound="PoolStats")
 
-@_attrs_define
-class PoolStats:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "total",
+        "cold",
+        "warming",
+        "warm",
+        "waiting",
+        "running",
+        "maxCapacity",
+        "resumeWarmHits",
+        "resumeColdHits",
+        "preWarmHits",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class PoolStats(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         total (int):
@@ -35,99 +53,49 @@ class PoolStats:
     resume_warm_hits: int
     resume_cold_hits: int
     pre_warm_hits: int
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        total = self.total
-
-        cold = self.cold
-
-        warming = self.warming
-
-        warm = self.warm
-
-        waiting = self.waiting
-
-        running = self.running
-
-        max_capacity = self.max_capacity
-
-        resume_warm_hits = self.resume_warm_hits
-
-        resume_cold_hits = self.resume_cold_hits
-
-        pre_warm_hits = self.pre_warm_hits
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "total": total,
-                "cold": cold,
-                "warming": warming,
-                "warm": warm,
-                "waiting": waiting,
-                "running": running,
-                "maxCapacity": max_capacity,
-                "resumeWarmHits": resume_warm_hits,
-                "resumeColdHits": resume_cold_hits,
-                "preWarmHits": pre_warm_hits,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "total": self.total,
+            "cold": self.cold,
+            "warming": self.warming,
+            "warm": self.warm,
+            "waiting": self.waiting,
+            "running": self.running,
+            "maxCapacity": self.max_capacity,
+            "resumeWarmHits": self.resume_warm_hits,
+            "resumeColdHits": self.resume_cold_hits,
+            "preWarmHits": self.pre_warm_hits,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        total = d.pop("total")
-
-        cold = d.pop("cold")
-
-        warming = d.pop("warming")
-
-        warm = d.pop("warm")
-
-        waiting = d.pop("waiting")
-
-        running = d.pop("running")
-
-        max_capacity = d.pop("maxCapacity")
-
-        resume_warm_hits = d.pop("resumeWarmHits")
-
-        resume_cold_hits = d.pop("resumeColdHits")
-
-        pre_warm_hits = d.pop("preWarmHits")
-
         pool_stats = cls(
-            total=total,
-            cold=cold,
-            warming=warming,
-            warm=warm,
-            waiting=waiting,
-            running=running,
-            max_capacity=max_capacity,
-            resume_warm_hits=resume_warm_hits,
-            resume_cold_hits=resume_cold_hits,
-            pre_warm_hits=pre_warm_hits,
+            src_dict["total"],
+            src_dict["cold"],
+            src_dict["warming"],
+            src_dict["warm"],
+            src_dict["waiting"],
+            src_dict["running"],
+            src_dict["maxCapacity"],
+            src_dict["resumeWarmHits"],
+            src_dict["resumeColdHits"],
+            src_dict["preWarmHits"],
         )
 
-        pool_stats.additional_properties = d
+        if len(src_dict) > 10:
+            pool_stats._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return pool_stats
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
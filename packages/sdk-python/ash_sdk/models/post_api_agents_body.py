@@ -1,22 +1,28 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
-
-if TYPE_CHECKING:
-    from ..models.post_api_agents_body_files_item import PostApiAgentsBodyFilesItem
-
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PostApiAgentsBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "name",
+        "path",
+        "systemPrompt",
+        "files",
+    )
+)
 
-@_attrs_define
-class PostApiAgentsBody:
+
+@_attrs_define(weakref_slot=False)
+class PostApiAgentsBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         name (str):
@@ -29,80 +35,53 @@ class PostApiAgentsBody:
     path: str | Unset = UNSET
     system_prompt: str | Unset = UNSET
     files: list[PostApiAgentsBodyFilesItem] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        name = self.name
-
-        path = self.path
-
-        system_prompt = self.system_prompt
-
-        files: list[dict[str, Any]] | Unset = UNSET
-        if not isinstance(self.files, Unset):
-            files = []
-            for files_item_data in self.files:
-                files_item = files_item_data.to_dict()
-                files.append(files_item)
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "name": name,
-            }
-        )
-        if path is not UNSET:
-            field_dict["path"] = path
-        if system_prompt is not UNSET:
-            field_dict["systemPrompt"] = system_prompt
-        if files is not UNSET:
-            field_dict["files"] = files
+        field_dict: dict[str, Any] = {
+            "name": self.name,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.path is not UNSET:
+            field_dict["path"] = self.path
+        if self.system_prompt is not UNSET:
+            field_dict["systemPrompt"] = self.system_prompt
+        if self.files is not UNSET:
+            field_dict["files"] = [files_item_data.to_dict() for files_item_data in self.files]
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.post_api_agents_body_files_item import PostApiAgentsBodyFilesItem
-
-        d = dict(src_dict)
-        name = d.pop("name")
-
-        path = d.pop("path", UNSET)
-
-        system_prompt = d.pop("systemPrompt", UNSET)
-
-        _files = d.pop("files", UNSET)
+        _files = src_dict.get("files", UNSET)
         files: list[PostApiAgentsBodyFilesItem] | Unset = UNSET
         if _files is not UNSET:
-            files = []
-            for files_item_data in _files:
-                files_item = PostApiAgentsBodyFilesItem.from_dict(files_item_data)
-
-                files.append(files_item)
+            files = PostApiAgentsBodyFilesItem.batch_from_dict(_files)
 
         post_api_agents_body = cls(
-            name=name,
-            path=path,
-            system_prompt=system_prompt,
-            files=files,
+            src_dict["name"],
+            src_dict.get("path", UNSET),
+            src_dict.get("systemPrompt", UNSET),
+            files,
         )
 
-        post_api_agents_body.additional_properties = d
+        if len(src_dict) > 1:
+            post_api_agents_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_agents_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.post_api_agents_body_files_item import PostApiAgentsBodyFilesItem
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import AdditionalPropertiesMixin
+
 T = TypeVar("T", bound="PostApiAgentsBodyFilesItem")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "path",
+        "content",
+    )
+)
+
 
-@_attrs_define
-class PostApiAgentsBodyFilesItem:
+@_attrs_define(weakref_slot=False)
+class PostApiAgentsBodyFilesItem(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         path (str):
@@ -19,51 +29,35 @@ class PostApiAgentsBodyFilesItem:
 
     path: str
     content: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        path = self.path
-
-        content = self.content
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "path": path,
-                "content": content,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "path": self.path,
+            "content": self.content,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        path = d.pop("path")
-
-        content = d.pop("content")
-
         post_api_agents_body_files_item = cls(
-            path=path,
-            content=content,
+            src_dict["path"],
+            src_dict["content"],
         )
 
-        post_api_agents_body_files_item.additional_properties = d
+        if len(src_dict) > 2:
+            post_api_agents_body_files_item._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_agents_body_files_item
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
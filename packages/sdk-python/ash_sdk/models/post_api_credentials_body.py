@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
@@ -10,13 +10,22 @@ from ..models.post_api_credentials_body_type import (
     PostApiCredentialsBodyType,
     check_post_api_credentials_body_type,
 )
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PostApiCredentialsBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "type",
+        "key",
+        "label",
+    )
+)
+
 
-@_attrs_define
-class PostApiCredentialsBody:
+@_attrs_define(weakref_slot=False)
+class PostApiCredentialsBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         type_ (PostApiCredentialsBodyType):
@@ -27,58 +36,39 @@ class PostApiCredentialsBody:
     type_: PostApiCredentialsBodyType
     key: str
     label: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        type_: str = self.type_
+        field_dict: dict[str, Any] = {
+            "type": self.type_,
+            "key": self.key,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
 
-        key = self.key
-
-        label = self.label
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type_,
-                "key": key,
-            }
-        )
-        if label is not UNSET:
-            field_dict["label"] = label
+        if self.label is not UNSET:
+            field_dict["label"] = self.label
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        type_ = check_post_api_credentials_body_type(d.pop("type"))
-
-        key = d.pop("key")
-
-        label = d.pop("label", UNSET)
-
         post_api_credentials_body = cls(
-            type_=type_,
-            key=key,
-            label=label,
+            check_post_api_credentials_body_type(src_dict["type"]),
+            src_dict["key"],
+            src_dict.get("label", UNSET),
         )
 
-        post_api_credentials_body.additional_properties = d
+        if len(src_dict) > 2:
+            post_api_credentials_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_credentials_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
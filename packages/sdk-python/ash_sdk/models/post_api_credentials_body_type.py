@@ -1,15 +1,22 @@
-from typing import Literal, cast
+from typing import Literal
 
 PostApiCredentialsBodyType = Literal["anthropic", "custom", "openai"]
 
-POST_API_CREDENTIALS_BODY_TYPE_VALUES: set[PostApiCredentialsBodyType] = {
-    "anthropic",
-    "custom",
-    "openai",
-}
+POST_API_CREDENTIALS_BODY_TYPE_VALUES: frozenset[PostApiCredentialsBodyType] = frozenset(
+    {
+        "anthropic",
+        "custom",
+        "openai",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, PostApiCredentialsBodyType] = {value: value for value in POST_API_CREDENTIALS_BODY_TYPE_VALUES}
 
 
 def check_post_api_credentials_body_type(value: str) -> PostApiCredentialsBodyType:
-    if value in POST_API_CREDENTIALS_BODY_TYPE_VALUES:
-        return cast(PostApiCredentialsBodyType, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {POST_API_CREDENTIALS_BODY_TYPE_VALUES!r}")
@@ -1,23 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.post_api_credentials_response_201_credential import (
-        PostApiCredentialsResponse201Credential,
-    )
-
-
 T = TypeVar("T", bound="PostApiCredentialsResponse201")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostApiCredentialsResponse201:
     """
     Attributes:
@@ -25,54 +18,39 @@ class PostApiCredentialsResponse201:
     """
 
     credential: PostApiCredentialsResponse201Credential | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        credential: dict[str, Any] | Unset = UNSET
-        if not isinstance(self.credential, Unset):
-            credential = self.credential.to_dict()
-
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if credential is not UNSET:
-            field_dict["credential"] = credential
+
+        if self.credential is not UNSET:
+            field_dict["credential"] = self.credential.to_dict()
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.post_api_credentials_response_201_credential import (
-            PostApiCredentialsResponse201Credential,
-        )
-
-        d = dict(src_dict)
-        _credential = d.pop("credential", UNSET)
+        _credential = src_dict.get("credential", UNSET)
         credential: PostApiCredentialsResponse201Credential | Unset
-        if isinstance(_credential, Unset):
+        if _credential is UNSET:
             credential = UNSET
         else:
             credential = PostApiCredentialsResponse201Credential.from_dict(_credential)
 
         post_api_credentials_response_201 = cls(
-            credential=credential,
+            credential,
         )
 
-        post_api_credentials_response_201.additional_properties = d
         return post_api_credentials_response_201
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.post_api_credentials_response_201_credential import (
+    PostApiCredentialsResponse201Credential,
+)
@@ -1,17 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from sys import intern
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
-from attrs import field as _attrs_field
 
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="PostApiCredentialsResponse201Credential")
 
 
-@_attrs_define
+@_attrs_define(weakref_slot=False)
 class PostApiCredentialsResponse201Credential:
     """
     Attributes:
@@ -27,71 +27,41 @@ class PostApiCredentialsResponse201Credential:
     label: str | Unset = UNSET
     active: bool | Unset = UNSET
     created_at: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        id = self.id
-
-        type_ = self.type_
-
-        label = self.label
-
-        active = self.active
-
-        created_at = self.created_at
-
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if id is not UNSET:
-            field_dict["id"] = id
-        if type_ is not UNSET:
-            field_dict["type"] = type_
-        if label is not UNSET:
-            field_dict["label"] = label
-        if active is not UNSET:
-            field_dict["active"] = active
-        if created_at is not UNSET:
-            field_dict["createdAt"] = created_at
+
+        if self.id is not UNSET:
+            field_dict["id"] = self.id
+        if self.type_ is not UNSET:
+            field_dict["type"] = self.type_
+        if self.label is not UNSET:
+            field_dict["label"] = self.label
+        if self.active is not UNSET:
+            field_dict["active"] = self.active
+        if self.created_at is not UNSET:
+            field_dict["createdAt"] = self.created_at
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = d.pop("id", UNSET)
-
-        type_ = d.pop("type", UNSET)
-
-        label = d.pop("label", UNSET)
-
-        active = d.pop("active", UNSET)
-
-        created_at = d.pop("createdAt", UNSET)
+        type_ = src_dict.get("type", UNSET)
+        if type_ is not UNSET:
+            type_ = intern(type_)
 
         post_api_credentials_response_201_credential = cls(
-            id=id,
-            type_=type_,
-            label=label,
-            active=active,
-            created_at=created_at,
+            src_dict.get("id", UNSET),
+            type_,
+            src_dict.get("label", UNSET),
+            src_dict.get("active", UNSET),
+            src_dict.get("createdAt", UNSET),
         )
 
-        post_api_credentials_response_201_credential.additional_properties = d
         return post_api_credentials_response_201_credential
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
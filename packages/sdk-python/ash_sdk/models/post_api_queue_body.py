@@ -1,19 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_uuid
 
 T = TypeVar("T", bound="PostApiQueueBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "agentName",
+        "prompt",
+        "sessionId",
+        "priority",
+        "maxRetries",
+    )
+)
 
-@_attrs_define
-class PostApiQueueBody:
+
+@_attrs_define(weakref_slot=False)
+class PostApiQueueBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         agent_name (str):
@@ -28,79 +39,52 @@ class PostApiQueueBody:
     session_id: UUID | Unset = UNSET
     priority: int | Unset = 0
     max_retries: int | Unset = 3
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        agent_name = self.agent_name
-
-        prompt = self.prompt
-
-        session_id: str | Unset = UNSET
-        if not isinstance(self.session_id, Unset):
-            session_id = str(self.session_id)
-
-        priority = self.priority
-
-        max_retries = self.max_retries
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "agentName": agent_name,
-                "prompt": prompt,
-            }
-        )
-        if session_id is not UNSET:
-            field_dict["sessionId"] = session_id
-        if priority is not UNSET:
-            field_dict["priority"] = priority
-        if max_retries is not UNSET:
-            field_dict["maxRetries"] = max_retries
+        field_dict: dict[str, Any] = {
+            "agentName": self.agent_name,
+            "prompt": self.prompt,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.session_id is not UNSET:
+            field_dict["sessionId"] = str(self.session_id)
+        if self.priority is not UNSET:
+            field_dict["priority"] = self.priority
+        if self.max_retries is not UNSET:
+            field_dict["maxRetries"] = self.max_retries
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        agent_name = d.pop("agentName")
-
-        prompt = d.pop("prompt")
-
-        _session_id = d.pop("sessionId", UNSET)
+        _session_id = src_dict.get("sessionId", UNSET)
         session_id: UUID | Unset
-        if isinstance(_session_id, Unset):
+        if _session_id is UNSET:
             session_id = UNSET
         else:
-            session_id = UUID(_session_id)
-
-        priority = d.pop("priority", UNSET)
-
-        max_retries = d.pop("maxRetries", UNSET)
+            session_id = parse_uuid(_session_id)
 
         post_api_queue_body = cls(
-            agent_name=agent_name,
-            prompt=prompt,
-            session_id=session_id,
-            priority=priority,
-            max_retries=max_retries,
+            src_dict["agentName"],
+            src_dict["prompt"],
+            session_id,
+            src_dict.get("priority", UNSET),
+            src_dict.get("maxRetries", UNSET),
         )
 
-        post_api_queue_body.additional_properties = d
+        if len(src_dict) > 2:
+            post_api_queue_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_queue_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
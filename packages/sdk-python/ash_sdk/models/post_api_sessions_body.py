@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
@@ -10,21 +10,31 @@ from ..models.post_api_sessions_body_permission_mode import (
     PostApiSessionsBodyPermissionMode,
     check_post_api_sessions_body_permission_mode,
 )
-from ..types import UNSET, Unset
-
-if TYPE_CHECKING:
-    from ..models.post_api_sessions_body_extra_env import PostApiSessionsBodyExtraEnv
-    from ..models.post_api_sessions_body_mcp_servers import (
-        PostApiSessionsBodyMcpServers,
-    )
-    from ..models.post_api_sessions_body_subagents import PostApiSessionsBodySubagents
-
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PostApiSessionsBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "agent",
+        "credentialId",
+        "extraEnv",
+        "model",
+        "mcpServers",
+        "systemPrompt",
+        "permissionMode",
+        "allowedTools",
+        "disallowedTools",
+        "betas",
+        "subagents",
+        "initialAgent",
+    )
+)
 
-@_attrs_define
-class PostApiSessionsBody:
+
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         agent (str):
@@ -56,166 +66,102 @@ class PostApiSessionsBody:
     betas: list[str] | Unset = UNSET
     subagents: PostApiSessionsBodySubagents | Unset = UNSET
     initial_agent: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        agent = self.agent
-
-        credential_id = self.credential_id
-
-        extra_env: dict[str, Any] | Unset = UNSET
-        if not isinstance(self.extra_env, Unset):
-            extra_env = self.extra_env.to_dict()
-
-        model = self.model
-
-        mcp_servers: dict[str, Any] | Unset = UNSET
-        if not isinstance(self.mcp_servers, Unset):
-            mcp_servers = self.mcp_servers.to_dict()
-
-        system_prompt = self.system_prompt
-
-        permission_mode: str | Unset = UNSET
-        if not isinstance(self.permission_mode, Unset):
-            permission_mode = self.permission_mode
-
-        allowed_tools: list[str] | Unset = UNSET
-        if not isinstance(self.allowed_tools, Unset):
-            allowed_tools = self.allowed_tools
-
-        disallowed_tools: list[str] | Unset = UNSET
-        if not isinstance(self.disallowed_tools, Unset):
-            disallowed_tools = self.disallowed_tools
-
-        betas: list[str] | Unset = UNSET
-        if not isinstance(self.betas, Unset):
-            betas = self.betas
-
-        subagents: dict[str, Any] | Unset = UNSET
-        if not isinstance(self.subagents, Unset):
-            subagents = self.subagents.to_dict()
-
-        initial_agent = self.initial_agent
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "agent": agent,
-            }
-        )
-        if credential_id is not UNSET:
-            field_dict["credentialId"] = credential_id
-        if extra_env is not UNSET:
-            field_dict["extraEnv"] = extra_env
-        if model is not UNSET:
-            field_dict["model"] = model
-        if mcp_servers is not UNSET:
-            field_dict["mcpServers"] = mcp_servers
-        if system_prompt is not UNSET:
-            field_dict["systemPrompt"] = system_prompt
-        if permission_mode is not UNSET:
-            field_dict["permissionMode"] = permission_mode
-        if allowed_tools is not UNSET:
-            field_dict["allowedTools"] = allowed_tools
-        if disallowed_tools is not UNSET:
-            field_dict["disallowedTools"] = disallowed_tools
-        if betas is not UNSET:
-            field_dict["betas"] = betas
-        if subagents is not UNSET:
-            field_dict["subagents"] = subagents
-        if initial_agent is not UNSET:
-            field_dict["initialAgent"] = initial_agent
+        field_dict: dict[str, Any] = {
+            "agent": self.agent,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.credential_id is not UNSET:
+            field_dict["credentialId"] = self.credential_id
+        if self.extra_env is not UNSET:
+            field_dict["extraEnv"] = self.extra_env.to_dict()
+        if self.model is not UNSET:
+            field_dict["model"] = self.model
+        if self.mcp_servers is not UNSET:
+            field_dict["mcpServers"] = self.mcp_servers.to_dict()
+        if self.system_prompt is not UNSET:
+            field_dict["systemPrompt"] = self.system_prompt
+        if self.permission_mode is not UNSET:
+            field_dict["permissionMode"] = self.permission_mode
+        if self.allowed_tools is not UNSET:
+            field_dict["allowedTools"] = self.allowed_tools
+        if self.disallowed_tools is not UNSET:
+            field_dict["disallowedTools"] = self.disallowed_tools
+        if self.betas is not UNSET:
+            field_dict["betas"] = self.betas
+        if self.subagents is not UNSET:
+            field_dict["subagents"] = self.subagents.to_dict()
+        if self.initial_agent is not UNSET:
+            field_dict["initialAgent"] = self.initial_agent
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.post_api_sessions_body_extra_env import (
-            PostApiSessionsBodyExtraEnv,
-        )
-        from ..models.post_api_sessions_body_mcp_servers import (
-            PostApiSessionsBodyMcpServers,
-        )
-        from ..models.post_api_sessions_body_subagents import (
-            PostApiSessionsBodySubagents,
-        )
-
-        d = dict(src_dict)
-        agent = d.pop("agent")
-
-        credential_id = d.pop("credentialId", UNSET)
-
-        _extra_env = d.pop("extraEnv", UNSET)
+        _extra_env = src_dict.get("extraEnv", UNSET)
         extra_env: PostApiSessionsBodyExtraEnv | Unset
-        if isinstance(_extra_env, Unset):
+        if _extra_env is UNSET:
             extra_env = UNSET
         else:
             extra_env = PostApiSessionsBodyExtraEnv.from_dict(_extra_env)
 
-        model = d.pop("model", UNSET)
-
-        _mcp_servers = d.pop("mcpServers", UNSET)
+        _mcp_servers = src_dict.get("mcpServers", UNSET)
         mcp_servers: PostApiSessionsBodyMcpServers | Unset
-        if isinstance(_mcp_servers, Unset):
+        if _mcp_servers is UNSET:
             mcp_servers = UNSET
         else:
             mcp_servers = PostApiSessionsBodyMcpServers.from_dict(_mcp_servers)
 
-        system_prompt = d.pop("systemPrompt", UNSET)
-
-        _permission_mode = d.pop("permissionMode", UNSET)
+        _permission_mode = src_dict.get("permissionMode", UNSET)
         permission_mode: PostApiSessionsBodyPermissionMode | Unset
-        if isinstance(_permission_mode, Unset):
+        if _permission_mode is UNSET:
             permission_mode = UNSET
         else:
             permission_mode = check_post_api_sessions_body_permission_mode(_permission_mode)
 
-        allowed_tools = cast(list[str], d.pop("allowedTools", UNSET))
-
-        disallowed_tools = cast(list[str], d.pop("disallowedTools", UNSET))
-
-        betas = cast(list[str], d.pop("betas", UNSET))
-
-        _subagents = d.pop("subagents", UNSET)
+        _subagents = src_dict.get("subagents", UNSET)
         subagents: PostApiSessionsBodySubagents | Unset
-        if isinstance(_subagents, Unset):
+        if _subagents is UNSET:
             subagents = UNSET
         else:
             subagents = PostApiSessionsBodySubagents.from_dict(_subagents)
 
-        initial_agent = d.pop("initialAgent", UNSET)
-
         post_api_sessions_body = cls(
-            agent=agent,
-            credential_id=credential_id,
-            extra_env=extra_env,
-            model=model,
-            mcp_servers=mcp_servers,
-            system_prompt=system_prompt,
-            permission_mode=permission_mode,
-            allowed_tools=allowed_tools,
-            disallowed_tools=disallowed_tools,
-            betas=betas,
-            subagents=subagents,
-            initial_agent=initial_agent,
+            src_dict["agent"],
+            src_dict.get("credentialId", UNSET),
+            extra_env,
+            src_dict.get("model", UNSET),
+            mcp_servers,
+            src_dict.get("systemPrompt", UNSET),
+            permission_mode,
+            src_dict.get("allowedTools", UNSET),
+            src_dict.get("disallowedTools", UNSET),
+            src_dict.get("betas", UNSET),
+            subagents,
+            src_dict.get("initialAgent", UNSET),
         )
 
-        post_api_sessions_body.additional_properties = d
+        if len(src_dict) > 1:
+            post_api_sessions_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_sessions_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.post_api_sessions_body_extra_env import PostApiSessionsBodyExtraEnv
+from ..models.post_api_sessions_body_mcp_servers import PostApiSessionsBodyMcpServers
+from ..models.post_api_sessions_body_subagents import PostApiSessionsBodySubagents
@@ -1,65 +1,50 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.post_api_sessions_body_mcp_servers_additional_property import (
-        PostApiSessionsBodyMcpServersAdditionalProperty,
-    )
-
+from ..types import AdditionalPropertiesMixin
 
 T = TypeVar("T", bound="PostApiSessionsBodyMcpServers")
 
 
-@_attrs_define
-class PostApiSessionsBodyMcpServers:
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsBodyMcpServers(AdditionalPropertiesMixin["PostApiSessionsBodyMcpServersAdditionalProperty"]):
     """Per-session MCP servers. Merged into agent .mcp.json (session overrides agent). Enables sidecar pattern."""
 
-    additional_properties: dict[str, PostApiSessionsBodyMcpServersAdditionalProperty] = _attrs_field(
-        init=False, factory=dict
+    _additional_properties: dict[str, PostApiSessionsBodyMcpServersAdditionalProperty] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
     )
 
     def to_dict(self) -> dict[str, Any]:
         field_dict: dict[str, Any] = {}
-        for prop_name, prop in self.additional_properties.items():
-            field_dict[prop_name] = prop.to_dict()
+        if self._additional_properties:
+            field_dict = {prop_name: prop.to_dict() for prop_name, prop in self._additional_properties.items()}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.post_api_sessions_body_mcp_servers_additional_property import (
-            PostApiSessionsBodyMcpServersAdditionalProperty,
-        )
-
-        d = dict(src_dict)
         post_api_sessions_body_mcp_servers = cls()
 
-        additional_properties = {}
-        for prop_name, prop_dict in d.items():
-            additional_property = PostApiSessionsBodyMcpServersAdditionalProperty.from_dict(prop_dict)
-
-            additional_properties[prop_name] = additional_property
-
-        post_api_sessions_body_mcp_servers.additional_properties = additional_properties
+        post_api_sessions_body_mcp_servers._additional_properties = {
+            prop_name: PostApiSessionsBodyMcpServersAdditionalProperty.from_dict(prop_dict)
+            for prop_name, prop_dict in src_dict.items()
+        } or None
         return post_api_sessions_body_mcp_servers
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> PostApiSessionsBodyMcpServersAdditionalProperty:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: PostApiSessionsBodyMcpServersAdditionalProperty) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.post_api_sessions_body_mcp_servers_additional_property import (
+    PostApiSessionsBodyMcpServersAdditionalProperty,
+)
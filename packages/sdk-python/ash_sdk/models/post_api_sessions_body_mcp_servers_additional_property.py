@@ -1,24 +1,28 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
-
-if TYPE_CHECKING:
-    from ..models.post_api_sessions_body_mcp_servers_additional_property_env import (
-        PostApiSessionsBodyMcpServersAdditionalPropertyEnv,
-    )
-
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PostApiSessionsBodyMcpServersAdditionalProperty")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "url",
+        "command",
+        "args",
+        "env",
+    )
+)
 
-@_attrs_define
-class PostApiSessionsBodyMcpServersAdditionalProperty:
+
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsBodyMcpServersAdditionalProperty(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         url (str | Unset):
@@ -31,77 +35,54 @@ class PostApiSessionsBodyMcpServersAdditionalProperty:
     command: str | Unset = UNSET
     args: list[str] | Unset = UNSET
     env: PostApiSessionsBodyMcpServersAdditionalPropertyEnv | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        url = self.url
-
-        command = self.command
-
-        args: list[str] | Unset = UNSET
-        if not isinstance(self.args, Unset):
-            args = self.args
-
-        env: dict[str, Any] | Unset = UNSET
-        if not isinstance(self.env, Unset):
-            env = self.env.to_dict()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if url is not UNSET:
-            field_dict["url"] = url
-        if command is not UNSET:
-            field_dict["command"] = command
-        if args is not UNSET:
-            field_dict["args"] = args
-        if env is not UNSET:
-            field_dict["env"] = env
+        field_dict: dict[str, Any] = dict(self._additional_properties) if self._additional_properties else {}
+        if self.url is not UNSET:
+            field_dict["url"] = self.url
+        if self.command is not UNSET:
+            field_dict["command"] = self.command
+        if self.args is not UNSET:
+            field_dict["args"] = self.args
+        if self.env is not UNSET:
+            field_dict["env"] = self.env.to_dict()
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.post_api_sessions_body_mcp_servers_additional_property_env import (
-            PostApiSessionsBodyMcpServersAdditionalPropertyEnv,
-        )
-
-        d = dict(src_dict)
-        url = d.pop("url", UNSET)
-
-        command = d.pop("command", UNSET)
-
-        args = cast(list[str], d.pop("args", UNSET))
-
-        _env = d.pop("env", UNSET)
+        _env = src_dict.get("env", UNSET)
         env: PostApiSessionsBodyMcpServersAdditionalPropertyEnv | Unset
-        if isinstance(_env, Unset):
+        if _env is UNSET:
             env = UNSET
         else:
             env = PostApiSessionsBodyMcpServersAdditionalPropertyEnv.from_dict(_env)
 
         post_api_sessions_body_mcp_servers_additional_property = cls(
-            url=url,
-            command=command,
-            args=args,
-            env=env,
+            src_dict.get("url", UNSET),
+            src_dict.get("command", UNSET),
+            src_dict.get("args", UNSET),
+            env,
         )
 
-        post_api_sessions_body_mcp_servers_additional_property.additional_properties = d
+        if len(src_dict) > 0:
+            post_api_sessions_body_mcp_servers_additional_property._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_sessions_body_mcp_servers_additional_property
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.post_api_sessions_body_mcp_servers_additional_property_env import (
+    PostApiSessionsBodyMcpServersAdditionalPropertyEnv,
+)
@@ -1,46 +1,38 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..types import AdditionalPropertiesMixin
+
 T = TypeVar("T", bound="PostApiSessionsBodyMcpServersAdditionalPropertyEnv")
 
 
-@_attrs_define
-class PostApiSessionsBodyMcpServersAdditionalPropertyEnv:
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsBodyMcpServersAdditionalPropertyEnv(AdditionalPropertiesMixin[str]):
     """ """
 
-    additional_properties: dict[str, str] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, str] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict: dict[str, Any] = dict(self._additional_properties) if self._additional_properties else {}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
         post_api_sessions_body_mcp_servers_additional_property_env = cls()
 
-        post_api_sessions_body_mcp_servers_additional_property_env.additional_properties = d
+        post_api_sessions_body_mcp_servers_additional_property_env._additional_properties = dict(src_dict) or None
         return post_api_sessions_body_mcp_servers_additional_property_env
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> str:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: str) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
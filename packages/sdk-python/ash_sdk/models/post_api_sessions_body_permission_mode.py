@@ -1,17 +1,26 @@
-from typing import Literal, cast
+from typing import Literal
 
 PostApiSessionsBodyPermissionMode = Literal["bypassPermissions", "default", "permissionsByAgent"]
 
-POST_API_SESSIONS_BODY_PERMISSION_MODE_VALUES: set[PostApiSessionsBodyPermissionMode] = {
-    "bypassPermissions",
-    "default",
-    "permissionsByAgent",
+POST_API_SESSIONS_BODY_PERMISSION_MODE_VALUES: frozenset[PostApiSessionsBodyPermissionMode] = frozenset(
+    {
+        "bypassPermissions",
+        "default",
+        "permissionsByAgent",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, PostApiSessionsBodyPermissionMode] = {
+    value: value for value in POST_API_SESSIONS_BODY_PERMISSION_MODE_VALUES
 }
 
 
 def check_post_api_sessions_body_permission_mode(
     value: str,
 ) -> PostApiSessionsBodyPermissionMode:
-    if value in POST_API_SESSIONS_BODY_PERMISSION_MODE_VALUES:
-        return cast(PostApiSessionsBodyPermissionMode, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {POST_API_SESSIONS_BODY_PERMISSION_MODE_VALUES!r}")
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_uuid
 
 T = TypeVar("T", bound="PostApiSessionsIdAttachmentsBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "filename",
+        "content",
+        "mimeType",
+        "messageId",
+    )
+)
 
-@_attrs_define
-class PostApiSessionsIdAttachmentsBody:
+
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsIdAttachmentsBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         filename (str):
@@ -26,72 +36,49 @@ class PostApiSessionsIdAttachmentsBody:
     content: str
     mime_type: str | Unset = "application/octet-stream"
     message_id: UUID | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        filename = self.filename
-
-        content = self.content
-
-        mime_type = self.mime_type
-
-        message_id: str | Unset = UNSET
-        if not isinstance(self.message_id, Unset):
-            message_id = str(self.message_id)
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "filename": filename,
-                "content": content,
-            }
-        )
-        if mime_type is not UNSET:
-            field_dict["mimeType"] = mime_type
-        if message_id is not UNSET:
-            field_dict["messageId"] = message_id
+        field_dict: dict[str, Any] = {
+            "filename": self.filename,
+            "content": self.content,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.mime_type is not UNSET:
+            field_dict["mimeType"] = self.mime_type
+        if self.message_id is not UNSET:
+            field_dict["messageId"] = str(self.message_id)
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        filename = d.pop("filename")
-
-        content = d.pop("content")
-
-        mime_type = d.pop("mimeType", UNSET)
-
-        _message_id = d.pop("messageId", UNSET)
+        _message_id = src_dict.get("messageId", UNSET)
         message_id: UUID | Unset
-        if isinstance(_message_id, Unset):
+        if _message_id is UNSET:
             message_id = UNSET
         else:
-            message_id = UUID(_message_id)
+            message_id = parse_uuid(_message_id)
 
         post_api_sessions_id_attachments_body = cls(
-            filename=filename,
-            content=content,
-            mime_type=mime_type,
-            message_id=message_id,
+            src_dict["filename"],
+            src_dict["content"],
+            src_dict.get("mimeType", UNSET),
+            message_id,
         )
 
-        post_api_sessions_id_attachments_body.additional_properties = d
+        if len(src_dict) > 2:
+            post_api_sessions_id_attachments_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_sessions_id_attachments_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
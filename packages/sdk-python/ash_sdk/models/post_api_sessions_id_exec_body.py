@@ -1,18 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PostApiSessionsIdExecBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "command",
+        "timeout",
+    )
+)
 
-@_attrs_define
-class PostApiSessionsIdExecBody:
+
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsIdExecBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         command (str):
@@ -21,52 +29,37 @@ class PostApiSessionsIdExecBody:
 
     command: str
     timeout: int | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        command = self.command
-
-        timeout = self.timeout
+        field_dict: dict[str, Any] = {
+            "command": self.command,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
 
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "command": command,
-            }
-        )
-        if timeout is not UNSET:
-            field_dict["timeout"] = timeout
+        if self.timeout is not UNSET:
+            field_dict["timeout"] = self.timeout
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        command = d.pop("command")
-
-        timeout = d.pop("timeout", UNSET)
-
         post_api_sessions_id_exec_body = cls(
-            command=command,
-            timeout=timeout,
+            src_dict["command"],
+            src_dict.get("timeout", UNSET),
         )
 
-        post_api_sessions_id_exec_body.additional_properties = d
+        if len(src_dict) > 1:
+            post_api_sessions_id_exec_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_sessions_id_exec_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,24 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
-
-if TYPE_CHECKING:
-    from ..models.post_api_sessions_id_files_body_files_item import (
-        PostApiSessionsIdFilesBodyFilesItem,
-    )
-
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PostApiSessionsIdFilesBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "files",
+        "targetPath",
+    )
+)
+
 
-@_attrs_define
-class PostApiSessionsIdFilesBody:
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsIdFilesBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         files (list[PostApiSessionsIdFilesBodyFilesItem]):
@@ -27,64 +29,44 @@ class PostApiSessionsIdFilesBody:
 
     files: list[PostApiSessionsIdFilesBodyFilesItem]
     target_path: str | Unset = "."
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        files = []
-        for files_item_data in self.files:
-            files_item = files_item_data.to_dict()
-            files.append(files_item)
-
-        target_path = self.target_path
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "files": files,
-            }
-        )
-        if target_path is not UNSET:
-            field_dict["targetPath"] = target_path
+        field_dict: dict[str, Any] = {
+            "files": [files_item_data.to_dict() for files_item_data in self.files],
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.target_path is not UNSET:
+            field_dict["targetPath"] = self.target_path
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.post_api_sessions_id_files_body_files_item import (
-            PostApiSessionsIdFilesBodyFilesItem,
-        )
-
-        d = dict(src_dict)
-        files = []
-        _files = d.pop("files")
-        for files_item_data in _files:
-            files_item = PostApiSessionsIdFilesBodyFilesItem.from_dict(files_item_data)
-
-            files.append(files_item)
-
-        target_path = d.pop("targetPath", UNSET)
-
         post_api_sessions_id_files_body = cls(
-            files=files,
-            target_path=target_path,
+            PostApiSessionsIdFilesBodyFilesItem.batch_from_dict(src_dict["files"]),
+            src_dict.get("targetPath", UNSET),
         )
 
-        post_api_sessions_id_files_body.additional_properties = d
+        if len(src_dict) > 1:
+            post_api_sessions_id_files_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_sessions_id_files_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.post_api_sessions_id_files_body_files_item import (
+    PostApiSessionsIdFilesBodyFilesItem,
+)
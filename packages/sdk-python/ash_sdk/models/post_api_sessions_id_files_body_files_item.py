@@ -1,18 +1,27 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PostApiSessionsIdFilesBodyFilesItem")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "path",
+        "content",
+        "mimeType",
+    )
+)
 
-@_attrs_define
-class PostApiSessionsIdFilesBodyFilesItem:
+
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsIdFilesBodyFilesItem(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         path (str):
@@ -23,58 +32,39 @@ class PostApiSessionsIdFilesBodyFilesItem:
     path: str
     content: str
     mime_type: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        path = self.path
-
-        content = self.content
-
-        mime_type = self.mime_type
+        field_dict: dict[str, Any] = {
+            "path": self.path,
+            "content": self.content,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
 
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "path": path,
-                "content": content,
-            }
-        )
-        if mime_type is not UNSET:
-            field_dict["mimeType"] = mime_type
+        if self.mime_type is not UNSET:
+            field_dict["mimeType"] = self.mime_type
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        path = d.pop("path")
-
-        content = d.pop("content")
-
-        mime_type = d.pop("mimeType", UNSET)
-
         post_api_sessions_id_files_body_files_item = cls(
-            path=path,
-            content=content,
-            mime_type=mime_type,
+            src_dict["path"],
+            src_dict["content"],
+            src_dict.get("mimeType", UNSET),
         )
 
-        post_api_sessions_id_files_body_files_item.additional_properties = d
+        if len(src_dict) > 2:
+            post_api_sessions_id_files_body_files_item._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_sessions_id_files_body_files_item
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
@@ -10,22 +10,27 @@ from ..models.post_api_sessions_id_messages_body_effort import (
     PostApiSessionsIdMessagesBodyEffort,
     check_post_api_sessions_id_messages_body_effort,
 )
-from ..types import UNSET, Unset
-
-if TYPE_CHECKING:
-    from ..models.post_api_sessions_id_messages_body_output_format import (
-        PostApiSessionsIdMessagesBodyOutputFormat,
-    )
-    from ..models.post_api_sessions_id_messages_body_thinking import (
-        PostApiSessionsIdMessagesBodyThinking,
-    )
-
+from ..types import UNSET, AdditionalPropertiesMixin, Unset
 
 T = TypeVar("T", bound="PostApiSessionsIdMessagesBody")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "content",
+        "includePartialMessages",
+        "model",
+        "maxTurns",
+        "maxBudgetUsd",
+        "effort",
+        "thinking",
+        "outputFormat",
+    )
+)
 
-@_attrs_define
-class PostApiSessionsIdMessagesBody:
+
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsIdMessagesBody(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         content (str):
@@ -46,122 +51,86 @@ class PostApiSessionsIdMessagesBody:
     effort: PostApiSessionsIdMessagesBodyEffort | Unset = UNSET
     thinking: PostApiSessionsIdMessagesBodyThinking | Unset = UNSET
     output_format: PostApiSessionsIdMessagesBodyOutputFormat | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        content = self.content
-
-        include_partial_messages = self.include_partial_messages
-
-        model = self.model
-
-        max_turns = self.max_turns
-
-        max_budget_usd = self.max_budget_usd
-
-        effort: str | Unset = UNSET
-        if not isinstance(self.effort, Unset):
-            effort = self.effort
-
-        thinking: dict[str, Any] | Unset = UNSET
-        if not isinstance(self.thinking, Unset):
-            thinking = self.thinking.to_dict()
-
-        output_format: dict[str, Any] | Unset = UNSET
-        if not isinstance(self.output_format, Unset):
-            output_format = self.output_format.to_dict()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "content": content,
-            }
-        )
-        if include_partial_messages is not UNSET:
-            field_dict["includePartialMessages"] = include_partial_messages
-        if model is not UNSET:
-            field_dict["model"] = model
-        if max_turns is not UNSET:
-            field_dict["maxTurns"] = max_turns
-        if max_budget_usd is not UNSET:
-            field_dict["maxBudgetUsd"] = max_budget_usd
-        if effort is not UNSET:
-            field_dict["effort"] = effort
-        if thinking is not UNSET:
-            field_dict["thinking"] = thinking
-        if output_format is not UNSET:
-            field_dict["outputFormat"] = output_format
+        field_dict: dict[str, Any] = {
+            "content": self.content,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.include_partial_messages is not UNSET:
+            field_dict["includePartialMessages"] = self.include_partial_messages
+        if self.model is not UNSET:
+            field_dict["model"] = self.model
+        if self.max_turns is not UNSET:
+            field_dict["maxTurns"] = self.max_turns
+        if self.max_budget_usd is not UNSET:
+            field_dict["maxBudgetUsd"] = self.max_budget_usd
+        if self.effort is not UNSET:
+            field_dict["effort"] = self.effort
+        if self.thinking is not UNSET:
+            field_dict["thinking"] = self.thinking.to_dict()
+        if self.output_format is not UNSET:
+            field_dict["outputFormat"] = self.output_format.to_dict()
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.post_api_sessions_id_messages_body_output_format import (
-            PostApiSessionsIdMessagesBodyOutputFormat,
-        )
-        from ..models.post_api_sessions_id_messages_body_thinking import (
-            PostApiSessionsIdMessagesBodyThinking,
-        )
-
-        d = dict(src_dict)
-        content = d.pop("content")
-
-        include_partial_messages = d.pop("includePartialMessages", UNSET)
-
-        model = d.pop("model", UNSET)
-
-        max_turns = d.pop("maxTurns", UNSET)
-
-        max_budget_usd = d.pop("maxBudgetUsd", UNSET)
-
-        _effort = d.pop("effort", UNSET)
+        _effort = src_dict.get("effort", UNSET)
         effort: PostApiSessionsIdMessagesBodyEffort | Unset
-        if isinstance(_effort, Unset):
+        if _effort is UNSET:
             effort = UNSET
         else:
             effort = check_post_api_sessions_id_messages_body_effort(_effort)
 
-        _thinking = d.pop("thinking", UNSET)
+        _thinking = src_dict.get("thinking", UNSET)
         thinking: PostApiSessionsIdMessagesBodyThinking | Unset
-        if isinstance(_thinking, Unset):
+        if _thinking is UNSET:
             thinking = UNSET
         else:
             thinking = PostApiSessionsIdMessagesBodyThinking.from_dict(_thinking)
 
-        _output_format = d.pop("outputFormat", UNSET)
+        _output_format = src_dict.get("outputFormat", UNSET)
         output_format: PostApiSessionsIdMessagesBodyOutputFormat | Unset
-        if isinstance(_output_format, Unset):
+        if _output_format is UNSET:
             output_format = UNSET
         else:
             output_format = PostApiSessionsIdMessagesBodyOutputFormat.from_dict(_output_format)
 
         post_api_sessions_id_messages_body = cls(
-            content=content,
-            include_partial_messages=include_partial_messages,
-            model=model,
-            max_turns=max_turns,
-            max_budget_usd=max_budget_usd,
-            effort=effort,
-            thinking=thinking,
-            output_format=output_format,
+            src_dict["content"],
+            src_dict.get("includePartialMessages", UNSET),
+            src_dict.get("model", UNSET),
+            src_dict.get("maxTurns", UNSET),
+            src_dict.get("maxBudgetUsd", UNSET),
+            effort,
+            thinking,
+            output_format,
         )
 
-        post_api_sessions_id_messages_body.additional_properties = d
+        if len(src_dict) > 1:
+            post_api_sessions_id_messages_body._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_sessions_id_messages_body
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.post_api_sessions_id_messages_body_output_format import (
+    PostApiSessionsIdMessagesBodyOutputFormat,
+)
+from ..models.post_api_sessions_id_messages_body_thinking import (
+    PostApiSessionsIdMessagesBodyThinking,
+)
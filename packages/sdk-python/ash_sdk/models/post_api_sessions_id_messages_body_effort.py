@@ -1,18 +1,27 @@
-from typing import Literal, cast
+from typing import Literal
 
 PostApiSessionsIdMessagesBodyEffort = Literal["high", "low", "max", "medium"]
 
-POST_API_SESSIONS_ID_MESSAGES_BODY_EFFORT_VALUES: set[PostApiSessionsIdMessagesBodyEffort] = {
-    "high",
-    "low",
-    "max",
-    "medium",
+POST_API_SESSIONS_ID_MESSAGES_BODY_EFFORT_VALUES: frozenset[PostApiSessionsIdMessagesBodyEffort] = frozenset(
+    {
+        "high",
+        "low",
+        "max",
+        "medium",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, PostApiSessionsIdMessagesBodyEffort] = {
+    value: value for value in POST_API_SESSIONS_ID_MESSAGES_BODY_EFFORT_VALUES
 }
 
 
 def check_post_api_sessions_id_messages_body_effort(
     value: str,
 ) -> PostApiSessionsIdMessagesBodyEffort:
-    if value in POST_API_SESSIONS_ID_MESSAGES_BODY_EFFORT_VALUES:
-        return cast(PostApiSessionsIdMessagesBodyEffort, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {POST_API_SESSIONS_ID_MESSAGES_BODY_EFFORT_VALUES!r}")
@@ -1,22 +1,26 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.post_api_sessions_id_messages_body_output_format_schema import (
-        PostApiSessionsIdMessagesBodyOutputFormatSchema,
-    )
-
+from ..types import AdditionalPropertiesMixin
 
 T = TypeVar("T", bound="PostApiSessionsIdMessagesBodyOutputFormat")
 
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "type",
+        "schema",
+    )
+)
+
 
-@_attrs_define
-class PostApiSessionsIdMessagesBodyOutputFormat:
+@_attrs_define(weakref_slot=False)
+class PostApiSessionsIdMessagesBodyOutputFormat(AdditionalPropertiesMixin[Any]):
     """Output format constraint for this query.
 
     Attributes:
@@ -26,55 +30,42 @@ class PostApiSessionsIdMessagesBodyOutputFormat:
 
     type_: str
     schema: PostApiSessionsIdMessagesBodyOutputFormatSchema
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        type_ = self.type_
-
-        schema = self.schema.to_dict()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type_,
-                "schema": schema,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "type": self.type_,
+            "schema": self.schema.to_dict(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.post_api_sessions_id_messages_body_output_format_schema import (
-            PostApiSessionsIdMessagesBodyOutputFormatSchema,
-        )
-
-        d = dict(src_dict)
-        type_ = d.pop("type")
-
-        schema = PostApiSessionsIdMessagesBodyOutputFormatSchema.from_dict(d.pop("schema"))
-
         post_api_sessions_id_messages_body_output_format = cls(
-            type_=type_,
-            schema=schema,
+            src_dict["type"],
+            PostApiSessionsIdMessagesBodyOutputFormatSchema.from_dict(src_dict["schema"]),
         )
 
-        post_api_sessions_id_messages_body_output_format.additional_properties = d
+        if len(src_dict) > 2:
+            post_api_sessions_id_messages_body_output_format._additional_properties = {
+                k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS
+            } or None
         return post_api_sessions_id_messages_body_output_format
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
 
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
 
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+# Other models are imported once the class exists, so models that reference each other
+# resolve in either import order without a function-level import on every call
+from ..models.post_api_sessions_id_messages_body_output_format_schema import (
+    PostApiSessionsIdMessagesBodyOutputFormatSchema,
+)
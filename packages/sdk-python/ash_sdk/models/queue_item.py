@@ -1,22 +1,40 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
 from ..models.queue_item_status import QueueItemStatus, check_queue_item_status
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_datetime
 
 T = TypeVar("T", bound="QueueItem")
 
-
-@_attrs_define
-class QueueItem:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "id",
+        "agentName",
+        "prompt",
+        "status",
+        "priority",
+        "retryCount",
+        "maxRetries",
+        "createdAt",
+        "tenantId",
+        "sessionId",
+        "error",
+        "startedAt",
+        "completedAt",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class QueueItem(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         id (UUID):
@@ -47,166 +65,61 @@ class QueueItem:
     error: None | str | Unset = UNSET
     started_at: None | str | Unset = UNSET
     completed_at: None | str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        id = str(self.id)
-
-        agent_name = self.agent_name
-
-        prompt = self.prompt
-
-        status: str = self.status
-
-        priority = self.priority
-
-        retry_count = self.retry_count
-
-        max_retries = self.max_retries
-
-        created_at = self.created_at.isoformat()
-
-        tenant_id = self.tenant_id
-
-        session_id: None | str | Unset
-        if isinstance(self.session_id, Unset):
-            session_id = UNSET
-        else:
-            session_id = self.session_id
-
-        error: None | str | Unset
-        if isinstance(self.error, Unset):
-            error = UNSET
-        else:
-            error = self.error
-
-        started_at: None | str | Unset
-        if isinstance(self.started_at, Unset):
-            started_at = UNSET
-        else:
-            started_at = self.started_at
-
-        completed_at: None | str | Unset
-        if isinstance(self.completed_at, Unset):
-            completed_at = UNSET
-        else:
-            completed_at = self.completed_at
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "agentName": agent_name,
-                "prompt": prompt,
-                "status": status,
-                "priority": priority,
-                "retryCount": retry_count,
-                "maxRetries": max_retries,
-                "createdAt": created_at,
-            }
-        )
-        if tenant_id is not UNSET:
-            field_dict["tenantId"] = tenant_id
-        if session_id is not UNSET:
-            field_dict["sessionId"] = session_id
-        if error is not UNSET:
-            field_dict["error"] = error
-        if started_at is not UNSET:
-            field_dict["startedAt"] = started_at
-        if completed_at is not UNSET:
-            field_dict["completedAt"] = completed_at
+        field_dict: dict[str, Any] = {
+            "id": str(self.id),
+            "agentName": self.agent_name,
+            "prompt": self.prompt,
+            "status": self.status,
+            "priority": self.priority,
+            "retryCount": self.retry_count,
+            "maxRetries": self.max_retries,
+            "createdAt": self.created_at.isoformat(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.tenant_id is not UNSET:
+            field_dict["tenantId"] = self.tenant_id
+        if self.session_id is not UNSET:
+            field_dict["sessionId"] = self.session_id
+        if self.error is not UNSET:
+            field_dict["error"] = self.error
+        if self.started_at is not UNSET:
+            field_dict["startedAt"] = self.started_at
+        if self.completed_at is not UNSET:
+            field_dict["completedAt"] = self.completed_at
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
-
-        agent_name = d.pop("agentName")
-
-        prompt = d.pop("prompt")
-
-        status = check_queue_item_status(d.pop("status"))
-
-        priority = d.pop("priority")
-
-        retry_count = d.pop("retryCount")
-
-        max_retries = d.pop("maxRetries")
-
-        created_at = isoparse(d.pop("createdAt"))
-
-        tenant_id = d.pop("tenantId", UNSET)
-
-        def _parse_session_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        session_id = _parse_session_id(d.pop("sessionId", UNSET))
-
-        def _parse_error(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        error = _parse_error(d.pop("error", UNSET))
-
-        def _parse_started_at(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        started_at = _parse_started_at(d.pop("startedAt", UNSET))
-
-        def _parse_completed_at(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        completed_at = _parse_completed_at(d.pop("completedAt", UNSET))
-
         queue_item = cls(
-            id=id,
-            agent_name=agent_name,
-            prompt=prompt,
-            status=status,
-            priority=priority,
-            retry_count=retry_count,
-            max_retries=max_retries,
-            created_at=created_at,
-            tenant_id=tenant_id,
-            session_id=session_id,
-            error=error,
-            started_at=started_at,
-            completed_at=completed_at,
+            UUID(src_dict["id"]),
+            src_dict["agentName"],
+            src_dict["prompt"],
+            check_queue_item_status(src_dict["status"]),
+            src_dict["priority"],
+            src_dict["retryCount"],
+            src_dict["maxRetries"],
+            parse_datetime(src_dict["createdAt"]),
+            src_dict.get("tenantId", UNSET),
+            src_dict.get("sessionId", UNSET),
+            src_dict.get("error", UNSET),
+            src_dict.get("startedAt", UNSET),
+            src_dict.get("completedAt", UNSET),
         )
 
-        queue_item.additional_properties = d
+        if len(src_dict) > 8:
+            queue_item._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return queue_item
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
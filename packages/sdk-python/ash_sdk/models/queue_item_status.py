@@ -1,17 +1,24 @@
-from typing import Literal, cast
+from typing import Literal
 
 QueueItemStatus = Literal["cancelled", "completed", "failed", "pending", "processing"]
 
-QUEUE_ITEM_STATUS_VALUES: set[QueueItemStatus] = {
-    "cancelled",
-    "completed",
-    "failed",
-    "pending",
-    "processing",
-}
+QUEUE_ITEM_STATUS_VALUES: frozenset[QueueItemStatus] = frozenset(
+    {
+        "cancelled",
+        "completed",
+        "failed",
+        "pending",
+        "processing",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, QueueItemStatus] = {value: value for value in QUEUE_ITEM_STATUS_VALUES}
 
 
 def check_queue_item_status(value: str) -> QueueItemStatus:
-    if value in QUEUE_ITEM_STATUS_VALUES:
-        return cast(QueueItemStatus, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {QUEUE_ITEM_STATUS_VALUES!r}")
@@ -1,22 +1,36 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
 from ..models.session_status import SessionStatus, check_session_status
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_datetime, parse_uuid
 
 T = TypeVar("T", bound="Session")
 
-
-@_attrs_define
-class Session:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "id",
+        "agentName",
+        "sandboxId",
+        "status",
+        "createdAt",
+        "lastActiveAt",
+        "tenantId",
+        "runnerId",
+        "parentSessionId",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class Session(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         id (UUID):
@@ -39,53 +53,34 @@ class Session:
     tenant_id: str | Unset = UNSET
     runner_id: None | str | Unset = UNSET
     parent_session_id: None | Unset | UUID = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        id = str(self.id)
-
-        agent_name = self.agent_name
-
-        sandbox_id = self.sandbox_id
-
-        status: str = self.status
-
-        created_at = self.created_at.isoformat()
-
-        last_active_at = self.last_active_at.isoformat()
-
-        tenant_id = self.tenant_id
-
-        runner_id: None | str | Unset
-        if isinstance(self.runner_id, Unset):
-            runner_id = UNSET
-        else:
-            runner_id = self.runner_id
-
         parent_session_id: None | str | Unset
-        if isinstance(self.parent_session_id, Unset):
+        if self.parent_session_id is UNSET:
             parent_session_id = UNSET
         elif isinstance(self.parent_session_id, UUID):
             parent_session_id = str(self.parent_session_id)
         else:
             parent_session_id = self.parent_session_id
 
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "agentName": agent_name,
-                "sandboxId": sandbox_id,
-                "status": status,
-                "createdAt": created_at,
-                "lastActiveAt": last_active_at,
-            }
-        )
-        if tenant_id is not UNSET:
-            field_dict["tenantId"] = tenant_id
-        if runner_id is not UNSET:
-            field_dict["runnerId"] = runner_id
+        field_dict: dict[str, Any] = {
+            "id": str(self.id),
+            "agentName": self.agent_name,
+            "sandboxId": self.sandbox_id,
+            "status": self.status,
+            "createdAt": self.created_at.isoformat(),
+            "lastActiveAt": self.last_active_at.isoformat(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.tenant_id is not UNSET:
+            field_dict["tenantId"] = self.tenant_id
+        if self.runner_id is not UNSET:
+            field_dict["runnerId"] = self.runner_id
         if parent_session_id is not UNSET:
             field_dict["parentSessionId"] = parent_session_id
 
@@ -93,74 +88,31 @@ class Session:
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
-
-        agent_name = d.pop("agentName")
-
-        sandbox_id = d.pop("sandboxId")
-
-        status = check_session_status(d.pop("status"))
-
-        created_at = isoparse(d.pop("createdAt"))
-
-        last_active_at = isoparse(d.pop("lastActiveAt"))
-
-        tenant_id = d.pop("tenantId", UNSET)
-
-        def _parse_runner_id(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        runner_id = _parse_runner_id(d.pop("runnerId", UNSET))
-
-        def _parse_parent_session_id(data: object) -> None | Unset | UUID:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
+        parent_session_id = src_dict.get("parentSessionId", UNSET)
+        if isinstance(parent_session_id, str):
             try:
-                if not isinstance(data, str):
-                    raise TypeError()
-                parent_session_id_type_1 = UUID(data)
-
-                return parent_session_id_type_1
+                parent_session_id = parse_uuid(parent_session_id)
             except (TypeError, ValueError, AttributeError, KeyError):
                 pass
-            return cast(None | Unset | UUID, data)
-
-        parent_session_id = _parse_parent_session_id(d.pop("parentSessionId", UNSET))
 
         session = cls(
-            id=id,
-            agent_name=agent_name,
-            sandbox_id=sandbox_id,
-            status=status,
-            created_at=created_at,
-            last_active_at=last_active_at,
-            tenant_id=tenant_id,
-            runner_id=runner_id,
-            parent_session_id=parent_session_id,
+            UUID(src_dict["id"]),
+            src_dict["agentName"],
+            src_dict["sandboxId"],
+            check_session_status(src_dict["status"]),
+            parse_datetime(src_dict["createdAt"]),
+            parse_datetime(src_dict["lastActiveAt"]),
+            src_dict.get("tenantId", UNSET),
+            src_dict.get("runnerId", UNSET),
+            parent_session_id,
         )
 
-        session.additional_properties = d
+        if len(src_dict) > 6:
+            session._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return session
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,22 +1,34 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
-from typing import Any, TypeVar, cast
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
 from ..models.session_event_type import SessionEventType, check_session_event_type
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_datetime, parse_uuid
 
 T = TypeVar("T", bound="SessionEvent")
 
-
-@_attrs_define
-class SessionEvent:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "id",
+        "sessionId",
+        "type",
+        "sequence",
+        "createdAt",
+        "tenantId",
+        "data",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class SessionEvent(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         id (UUID):
@@ -35,94 +47,46 @@ class SessionEvent:
     created_at: datetime.datetime
     tenant_id: str | Unset = UNSET
     data: None | str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        id = str(self.id)
-
-        session_id = str(self.session_id)
-
-        type_: str = self.type_
-
-        sequence = self.sequence
-
-        created_at = self.created_at.isoformat()
-
-        tenant_id = self.tenant_id
-
-        data: None | str | Unset
-        if isinstance(self.data, Unset):
-            data = UNSET
-        else:
-            data = self.data
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "sessionId": session_id,
-                "type": type_,
-                "sequence": sequence,
-                "createdAt": created_at,
-            }
-        )
-        if tenant_id is not UNSET:
-            field_dict["tenantId"] = tenant_id
-        if data is not UNSET:
-            field_dict["data"] = data
+        field_dict: dict[str, Any] = {
+            "id": str(self.id),
+            "sessionId": str(self.session_id),
+            "type": self.type_,
+            "sequence": self.sequence,
+            "createdAt": self.created_at.isoformat(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.tenant_id is not UNSET:
+            field_dict["tenantId"] = self.tenant_id
+        if self.data is not UNSET:
+            field_dict["data"] = self.data
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
-
-        session_id = UUID(d.pop("sessionId"))
-
-        type_ = check_session_event_type(d.pop("type"))
-
-        sequence = d.pop("sequence")
-
-        created_at = isoparse(d.pop("createdAt"))
-
-        tenant_id = d.pop("tenantId", UNSET)
-
-        def _parse_data(data: object) -> None | str | Unset:
-            if data is None:
-                return data
-            if isinstance(data, Unset):
-                return data
-            return cast(None | str | Unset, data)
-
-        data = _parse_data(d.pop("data", UNSET))
-
         session_event = cls(
-            id=id,
-            session_id=session_id,
-            type_=type_,
-            sequence=sequence,
-            created_at=created_at,
-            tenant_id=tenant_id,
-            data=data,
+            UUID(src_dict["id"]),
+            parse_uuid(src_dict["sessionId"]),
+            check_session_event_type(src_dict["type"]),
+            src_dict["sequence"],
+            parse_datetime(src_dict["createdAt"]),
+            src_dict.get("tenantId", UNSET),
+            src_dict.get("data", UNSET),
         )
 
-        session_event.additional_properties = d
+        if len(src_dict) > 5:
+            session_event._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return session_event
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,4 +1,4 @@
-from typing import Literal, cast
+from typing import Literal
 
 SessionEventType = Literal[
     "error",
@@ -10,18 +10,25 @@ SessionEventType = Literal[
     "turn_complete",
 ]
 
-SESSION_EVENT_TYPE_VALUES: set[SessionEventType] = {
-    "error",
-    "lifecycle",
-    "reasoning",
-    "text",
-    "tool_result",
-    "tool_start",
-    "turn_complete",
-}
+SESSION_EVENT_TYPE_VALUES: frozenset[SessionEventType] = frozenset(
+    {
+        "error",
+        "lifecycle",
+        "reasoning",
+        "text",
+        "tool_result",
+        "tool_start",
+        "turn_complete",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, SessionEventType] = {value: value for value in SESSION_EVENT_TYPE_VALUES}
 
 
 def check_session_event_type(value: str) -> SessionEventType:
-    if value in SESSION_EVENT_TYPE_VALUES:
-        return cast(SessionEventType, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {SESSION_EVENT_TYPE_VALUES!r}")
@@ -1,18 +1,25 @@
-from typing import Literal, cast
+from typing import Literal
 
 SessionStatus = Literal["active", "ended", "error", "paused", "starting", "stopped"]
 
-SESSION_STATUS_VALUES: set[SessionStatus] = {
-    "active",
-    "ended",
-    "error",
-    "paused",
-    "starting",
-    "stopped",
-}
+SESSION_STATUS_VALUES: frozenset[SessionStatus] = frozenset(
+    {
+        "active",
+        "ended",
+        "error",
+        "paused",
+        "starting",
+        "stopped",
+    }
+)
+
+# Maps each accepted value to the module's own constant, so decoded rows share one interned
+# string per value instead of each holding its own copy from the payload
+_CANONICAL: dict[str, SessionStatus] = {value: value for value in SESSION_STATUS_VALUES}
 
 
 def check_session_status(value: str) -> SessionStatus:
-    if value in SESSION_STATUS_VALUES:
-        return cast(SessionStatus, value)
+    canonical = _CANONICAL.get(value)
+    if canonical is not None:
+        return canonical
     raise TypeError(f"Unexpected value {value!r}. Expected one of {SESSION_STATUS_VALUES!r}")
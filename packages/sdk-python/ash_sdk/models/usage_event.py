@@ -1,21 +1,33 @@
 from __future__ import annotations
 
 import datetime
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 from uuid import UUID
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
-from ..types import UNSET, Unset
+from ..types import UNSET, AdditionalPropertiesMixin, Unset, parse_datetime, parse_uuid
 
 T = TypeVar("T", bound="UsageEvent")
 
-
-@_attrs_define
-class UsageEvent:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "id",
+        "sessionId",
+        "agentName",
+        "eventType",
+        "value",
+        "createdAt",
+        "tenantId",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class UsageEvent(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         id (UUID):
@@ -34,82 +46,45 @@ class UsageEvent:
     value: float
     created_at: datetime.datetime
     tenant_id: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        id = str(self.id)
-
-        session_id = str(self.session_id)
-
-        agent_name = self.agent_name
-
-        event_type = self.event_type
-
-        value = self.value
-
-        created_at = self.created_at.isoformat()
-
-        tenant_id = self.tenant_id
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "sessionId": session_id,
-                "agentName": agent_name,
-                "eventType": event_type,
-                "value": value,
-                "createdAt": created_at,
-            }
-        )
-        if tenant_id is not UNSET:
-            field_dict["tenantId"] = tenant_id
+        field_dict: dict[str, Any] = {
+            "id": str(self.id),
+            "sessionId": str(self.session_id),
+            "agentName": self.agent_name,
+            "eventType": self.event_type,
+            "value": self.value,
+            "createdAt": self.created_at.isoformat(),
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
+
+        if self.tenant_id is not UNSET:
+            field_dict["tenantId"] = self.tenant_id
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = UUID(d.pop("id"))
-
-        session_id = UUID(d.pop("sessionId"))
-
-        agent_name = d.pop("agentName")
-
-        event_type = d.pop("eventType")
-
-        value = d.pop("value")
-
-        created_at = isoparse(d.pop("createdAt"))
-
-        tenant_id = d.pop("tenantId", UNSET)
-
         usage_event = cls(
-            id=id,
-            session_id=session_id,
-            agent_name=agent_name,
-            event_type=event_type,
-            value=value,
-            created_at=created_at,
-            tenant_id=tenant_id,
+            UUID(src_dict["id"]),
+            parse_uuid(src_dict["sessionId"]),
+            src_dict["agentName"],
+            src_dict["eventType"],
+            src_dict["value"],
+            parse_datetime(src_dict["createdAt"]),
+            src_dict.get("tenantId", UNSET),
         )
 
-        usage_event.additional_properties = d
+        if len(src_dict) > 6:
+            usage_event._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return usage_event
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-T = TypeVar("T", bound="UsageStats")
+from ..types import AdditionalPropertiesMixin
 
+T = TypeVar("T", bound="UsageStats")
 
-@_attrs_define
-class UsageStats:
+# Keys consumed by declared fields; everything else lands in additional_properties
+_KNOWN_KEYS: frozenset[str] = frozenset(
+    (
+        "totalInputTokens",
+        "totalOutputTokens",
+        "totalCacheCreationTokens",
+        "totalCacheReadTokens",
+        "totalToolCalls",
+        "totalMessages",
+        "totalComputeSeconds",
+    )
+)
+
+
+@_attrs_define(weakref_slot=False)
+class UsageStats(AdditionalPropertiesMixin[Any]):
     """
     Attributes:
         total_input_tokens (float):
@@ -29,81 +44,43 @@ class UsageStats:
     total_tool_calls: float
     total_messages: float
     total_compute_seconds: float
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lambda extras: extras or None
+    )
 
     def to_dict(self) -> dict[str, Any]:
-        total_input_tokens = self.total_input_tokens
-
-        total_output_tokens = self.total_output_tokens
-
-        total_cache_creation_tokens = self.total_cache_creation_tokens
-
-        total_cache_read_tokens = self.total_cache_read_tokens
-
-        total_tool_calls = self.total_tool_calls
-
-        total_messages = self.total_messages
-
-        total_compute_seconds = self.total_compute_seconds
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "totalInputTokens": total_input_tokens,
-                "totalOutputTokens": total_output_tokens,
-                "totalCacheCreationTokens": total_cache_creation_tokens,
-                "totalCacheReadTokens": total_cache_read_tokens,
-                "totalToolCalls": total_tool_calls,
-                "totalMessages": total_messages,
-                "totalComputeSeconds": total_compute_seconds,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            "totalInputTokens": self.total_input_tokens,
+            "totalOutputTokens": self.total_output_tokens,
+            "totalCacheCreationTokens": self.total_cache_creation_tokens,
+            "totalCacheReadTokens": self.total_cache_read_tokens,
+            "totalToolCalls": self.total_tool_calls,
+            "totalMessages": self.total_messages,
+            "totalComputeSeconds": self.total_compute_seconds,
+        }
+        if self._additional_properties:
+            field_dict = {**self._additional_properties, **field_dict}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        total_input_tokens = d.pop("totalInputTokens")
-
-        total_output_tokens = d.pop("totalOutputTokens")
-
-        total_cache_creation_tokens = d.pop("totalCacheCreationTokens")
-
-        total_cache_read_tokens = d.pop("totalCacheReadTokens")
-
-        total_tool_calls = d.pop("totalToolCalls")
-
-        total_messages = d.pop("totalMessages")
-
-        total_compute_seconds = d.pop("totalComputeSeconds")
-
         usage_stats = cls(
-            total_input_tokens=total_input_tokens,
-            total_output_tokens=total_output_tokens,
-            total_cache_creation_tokens=total_cache_creation_tokens,
-            total_cache_read_tokens=total_cache_read_tokens,
-            total_tool_calls=total_tool_calls,
-            total_messages=total_messages,
-            total_compute_seconds=total_compute_seconds,
+            src_dict["totalInputTokens"],
+            src_dict["totalOutputTokens"],
+            src_dict["totalCacheCreationTokens"],
+            src_dict["totalCacheReadTokens"],
+            src_dict["totalToolCalls"],
+            src_dict["totalMessages"],
+            src_dict["totalComputeSeconds"],
         )
 
-        usage_stats.additional_properties = d
+        if len(src_dict) > 7:
+            usage_stats._additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS} or None
         return usage_stats
 
-    @property
-    def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
-
-    def __getitem__(self, key: str) -> Any:
-        return self.additional_properties[key]
-
-    def __setitem__(self, key: str, value: Any) -> None:
-        self.additional_properties[key] = value
-
-    def __delitem__(self, key: str) -> None:
-        del self.additional_properties[key]
-
-    def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+    @classmethod
+    def batch_from_dict(cls: type[T], rows: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build one instance per row, e.g. for the items of a list response."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
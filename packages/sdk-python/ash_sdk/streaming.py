@@ -9,14 +9,16 @@ POST /api/sessions/{id}/messages endpoint.
 
 from __future__ import annotations
 
-import json
+from collections.abc import AsyncIterable, Iterable
 from dataclasses import dataclass, field
 from typing import Any, AsyncGenerator, Generator, Iterator
 
 import httpx
 
+from ._json import loads_str
 
-@dataclass
+
+@dataclass(slots=True)
 class StreamEvent:
     """A parsed SSE event from the Ash server.
 
@@ -29,7 +31,7 @@ class StreamEvent:
     data: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class MessageEvent:
     """An SDK Message event (event: message).
 
@@ -40,21 +42,33 @@ class MessageEvent:
     data: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class TextDeltaEvent:
     """Incremental text chunk (event: text_delta)."""
 
     delta: str
 
 
-@dataclass
+@dataclass(slots=True)
+class CoalescedTextDeltaEvent:
+    """A run of consecutive text_delta events, yielded when coalescing is enabled."""
+
+    events: list[TextDeltaEvent]
+
+    @property
+    def delta(self) -> str:
+        """The concatenated text of all deltas in the run."""
+        return "".join(e.delta for e in self.events)
+
+
+@dataclass(slots=True)
 class ThinkingDeltaEvent:
     """Incremental thinking content (event: thinking_delta)."""
 
     delta: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolUseEvent:
     """Tool invocation (event: tool_use)."""
 
@@ -63,7 +77,7 @@ class ToolUseEvent:
     input: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResultEvent:
     """Tool execution result (event: tool_result)."""
 
@@ -72,7 +86,7 @@ class ToolResultEvent:
     is_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnCompleteEvent:
     """Agent turn completed (event: turn_complete)."""
 
@@ -80,7 +94,7 @@ class TurnCompleteEvent:
     result: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStartEvent:
     """Session start marker (event: session_start)."""
 
@@ -88,14 +102,14 @@ class SessionStartEvent:
     version: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent:
     """Error from the server (event: error)."""
 
     error: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DoneEvent:
     """Stream termination (event: done)."""
 
@@ -106,6 +120,7 @@ class DoneEvent:
 AshEvent = (
     MessageEvent
     | TextDeltaEvent
+    | CoalescedTextDeltaEvent
     | ThinkingDeltaEvent
     | ToolUseEvent
     | ToolResultEvent
@@ -145,11 +160,115 @@ def _parse_event(event_type: str, data: dict[str, Any]) -> AshEvent:
         return StreamEvent(event=event_type, data=data)
 
 
+def _parse_sse_frame(frame: str) -> AshEvent | None:
+    """Parse one complete SSE frame (the text between blank lines).
+
+    Returns None for frames without a data field or with non-JSON data.
+    """
+    current_event = ""
+    data_lines: list[str] = []
+    for line in frame.split("\n"):
+        name, _, value = line.partition(": ")
+        if name == "event":
+            current_event = value.strip()
+        elif name == "data":
+            data_lines.append(value)
+    if not data_lines:
+        return None
+    try:
+        data = loads_str("\n".join(data_lines))
+    except ValueError:  # JSONDecodeError from json or orjson
+        return None  # Skip non-JSON data frames
+    return _parse_event(current_event, data)
+
+
+class _SSEFrameBuffer:
+    """Accumulates raw stream bytes and parses each SSE frame once it is complete.
+
+    Shared by the sync and async parsers so both frame the stream identically.
+    Line endings are normalised to LF chunk by chunk, and each feed only scans
+    the bytes it added, so a large frame arriving in many chunks stays linear.
+    """
+
+    __slots__ = ("_buf", "_pending_cr")
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._pending_cr = False  # previous chunk ended in CR; a leading LF belongs to it
+
+    def feed(self, chunk: bytes) -> list[AshEvent]:
+        """Append a chunk and return the events of every frame it completed."""
+        if self._pending_cr and chunk:
+            self._pending_cr = False
+            if chunk.startswith(b"\n"):
+                chunk = chunk[1:]
+        if b"\r" in chunk:
+            self._pending_cr = chunk[-1:] == b"\r"
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        buf = self._buf
+        # Everything already buffered holds no blank line, so only a separator
+        # straddling the old tail can start before the new bytes.
+        start = len(buf) - 1 if buf else 0
+        buf += chunk
+        end = buf.rfind(b"\n\n", start)
+        if end == -1:
+            return []
+        # A multi-byte UTF-8 sequence never spans a newline, so the completed
+        # frames can be decoded together.
+        frames = buf[:end].decode("utf-8", "replace").split("\n\n")
+        del buf[: end + 2]
+        return [event for frame in frames if (event := _parse_sse_frame(frame)) is not None]
+
+    def close(self) -> list[AshEvent]:
+        """Parse whatever is left once the stream ends without a trailing blank line."""
+        self._pending_cr = False
+        if not self._buf:
+            return []
+        event = _parse_sse_frame(self._buf.decode("utf-8", "replace"))
+        self._buf.clear()
+        return [event] if event is not None else []
+
+
+def parse_sse_batches(response: httpx.Response) -> Generator[list[AshEvent], None, None]:
+    """Parse an SSE stream into one list of events per network read (sync).
+
+    Each list holds the events whose frames were completed by a single chunk,
+    in arrival order; reads that complete no frame yield nothing. Useful for
+    handling everything that is already available without waiting for more.
+
+    Args:
+        response: An httpx.Response from a streaming request.
+
+    Yields:
+        Non-empty lists of typed event objects.
+    """
+    frames = _SSEFrameBuffer()
+    for chunk in response.iter_bytes():
+        if events := frames.feed(chunk):
+            yield events
+    if events := frames.close():
+        yield events
+
+
+async def parse_sse_batches_async(response: httpx.Response) -> AsyncGenerator[list[AshEvent], None]:
+    """Parse an SSE stream into one list of events per network read (async).
+
+    See ``parse_sse_batches``.
+    """
+    frames = _SSEFrameBuffer()
+    async for chunk in response.aiter_bytes():
+        if events := frames.feed(chunk):
+            yield events
+    if events := frames.close():
+        yield events
+
+
 def parse_sse_stream(response: httpx.Response) -> Generator[AshEvent, None, None]:
     """Parse an SSE stream from an httpx Response (sync).
 
-    Iterates over the response bytes line-by-line, parsing SSE frames into
-    typed event objects.
+    Reads raw byte chunks into a reusable buffer and only decodes once a
+    complete frame (terminated by a blank line) has arrived, so httpx doesn't
+    build a str for every line.
 
     Args:
         response: An httpx.Response from a streaming request.
@@ -157,24 +276,16 @@ def parse_sse_stream(response: httpx.Response) -> Generator[AshEvent, None, None
     Yields:
         Typed event objects (MessageEvent, TextDeltaEvent, ErrorEvent, etc.).
     """
-    current_event = ""
-    for line in response.iter_lines():
-        if line.startswith("event: "):
-            current_event = line[7:].strip()
-        elif line.startswith("data: "):
-            raw = line[6:]
-            try:
-                data = json.loads(raw)
-                yield _parse_event(current_event, data)
-            except json.JSONDecodeError:
-                pass  # Skip non-JSON data lines
+    for events in parse_sse_batches(response):
+        yield from events
 
 
 async def parse_sse_stream_async(response: httpx.Response) -> AsyncGenerator[AshEvent, None]:
     """Parse an SSE stream from an httpx Response (async).
 
-    Iterates over the response bytes line-by-line, parsing SSE frames into
-    typed event objects.
+    Reads raw byte chunks into a reusable buffer and only decodes once a
+    complete frame (terminated by a blank line) has arrived, so small
+    network chunks don't each allocate a str.
 
     Args:
         response: An httpx.Response from a streaming request.
@@ -182,14 +293,57 @@ async def parse_sse_stream_async(response: httpx.Response) -> AsyncGenerator[Ash
     Yields:
         Typed event objects (MessageEvent, TextDeltaEvent, ErrorEvent, etc.).
     """
-    current_event = ""
-    async for line in response.aiter_lines():
-        if line.startswith("event: "):
-            current_event = line[7:].strip()
-        elif line.startswith("data: "):
-            raw = line[6:]
-            try:
-                data = json.loads(raw)
-                yield _parse_event(current_event, data)
-            except json.JSONDecodeError:
-                pass  # Skip non-JSON data lines
+    async for events in parse_sse_batches_async(response):
+        for event in events:
+            yield event
+
+
+# Maximum number of text deltas in one coalesced batch
+COALESCE_MAX_EVENTS = 32
+
+
+def _coalesce_batch(events: list[AshEvent], max_events: int) -> list[AshEvent]:
+    """Group the consecutive TextDeltaEvents of one read; the result never waits on later reads."""
+    out: list[AshEvent] = []
+    run: list[TextDeltaEvent] = []
+    for event in events:
+        if isinstance(event, TextDeltaEvent):
+            run.append(event)
+            if len(run) >= max_events:
+                out.append(CoalescedTextDeltaEvent(events=run))
+                run = []
+            continue
+        if run:
+            out.append(CoalescedTextDeltaEvent(events=run))
+            run = []
+        out.append(event)
+    if run:
+        out.append(CoalescedTextDeltaEvent(events=run))
+    return out
+
+
+def coalesce_text_deltas(
+    batches: Iterable[list[AshEvent]], max_events: int = COALESCE_MAX_EVENTS
+) -> Generator[AshEvent, None, None]:
+    """Group consecutive TextDeltaEvents into CoalescedTextDeltaEvents (sync).
+
+    Takes the per-read batches from ``parse_sse_batches``. Deltas are only
+    grouped within one batch, so text is handed over as soon as it has been
+    read; a group is also split at ``max_events`` deltas or by any other event.
+    All other events pass through unchanged and in order.
+    """
+    for events in batches:
+        yield from _coalesce_batch(events, max_events)
+
+
+async def coalesce_text_deltas_async(
+    batches: AsyncIterable[list[AshEvent]], max_events: int = COALESCE_MAX_EVENTS
+) -> AsyncGenerator[AshEvent, None]:
+    """Group consecutive TextDeltaEvents into CoalescedTextDeltaEvents (async).
+
+    Takes the per-read batches from ``parse_sse_batches_async``; see
+    ``coalesce_text_deltas``.
+    """
+    async for events in batches:
+        for event in _coalesce_batch(events, max_events):
+            yield event
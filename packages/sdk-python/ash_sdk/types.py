@@ -1,19 +1,55 @@
 """Contains some shared types for properties"""
 
-from collections.abc import Mapping, MutableMapping
+import datetime
+import sys
+from collections.abc import Callable, Mapping, MutableMapping
+from functools import lru_cache
 from http import HTTPStatus
 from typing import IO, BinaryIO, Generic, Literal, TypeVar
+from uuid import UUID
 
 from attrs import define
 
 
 class Unset:
+    """Sentinel for fields omitted from a payload; ``UNSET`` is its only instance, so it can be tested with ``is``"""
+
+    _instance: "Unset | None" = None
+
+    def __new__(cls) -> "Unset":
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
     def __bool__(self) -> Literal[False]:
         return False
 
 
 UNSET: Unset = Unset()
 
+
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 timestamp from an API payload
+
+    Uses the C-implemented ``datetime.fromisoformat`` for the server's standard
+    format and falls back to ``dateutil`` for anything it does not accept.
+    """
+    if sys.version_info < (3, 11) and value[-1:] == "Z":
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        # Imported here so dateutil's parser stays out of `import ash_sdk`; only reached for non-ISO input
+        from dateutil.parser import isoparse
+
+        return isoparse(value)
+
+
+# Parses UUID strings, reusing the object for ids seen recently. Meant for fields that
+# reference another resource (e.g. every message in a listing carries the same sessionId);
+# UUID is immutable, so sharing one instance between rows is safe.
+parse_uuid: Callable[[str], UUID] = lru_cache(maxsize=1024)(UUID)
+
 # The types that `httpx.Client(files=)` can accept, copied from that library.
 FileContent = IO[bytes] | bytes | str
 FileTypes = (
@@ -51,4 +87,60 @@ class Response(Generic[T]):
     parsed: T | None
 
 
-__all__ = ["UNSET", "File", "FileTypes", "RequestFiles", "Response", "Unset"]
+V = TypeVar("V")
+
+
+class AdditionalPropertiesMixin(Generic[V]):
+    """Mapping-style access to the fields a model does not declare
+
+    Models keep these in an ``_additional_properties`` slot that stays ``None`` until
+    something is stored, so reads never allocate.
+    """
+
+    __slots__ = ()
+
+    _additional_properties: dict[str, V] | None
+
+    @property
+    def additional_properties(self) -> dict[str, V]:
+        """Fields not declared in the schema; the dict is only allocated once used"""
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, V]) -> None:
+        self._additional_properties = value
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self._additional_properties) if self._additional_properties else []
+
+    def __getitem__(self, key: str) -> V:
+        if self._additional_properties is None:
+            raise KeyError(key)
+        return self._additional_properties[key]
+
+    def __setitem__(self, key: str, value: V) -> None:
+        self.additional_properties[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if self._additional_properties is None:
+            raise KeyError(key)
+        del self._additional_properties[key]
+
+    def __contains__(self, key: str) -> bool:
+        return self._additional_properties is not None and key in self._additional_properties
+
+
+__all__ = [
+    "UNSET",
+    "AdditionalPropertiesMixin",
+    "File",
+    "FileTypes",
+    "RequestFiles",
+    "Response",
+    "Unset",
+    "parse_datetime",
+    "parse_uuid",
+]
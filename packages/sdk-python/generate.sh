@@ -12,6 +12,8 @@ set -euo pipefail
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
 SPEC="${SCRIPT_DIR}/../../packages/server/openapi.json"
 CONFIG="${SCRIPT_DIR}/openapi-python-client-config.yml"
+# Jinja overrides for the default generator templates (see templates/)
+TEMPLATES="${SCRIPT_DIR}/templates"
 TMP_DIR=$(mktemp -d)
 GEN_DIR="${TMP_DIR}/out"
 BACKUP_DIR="${TMP_DIR}/preserved"
@@ -20,6 +22,7 @@ BACKUP_DIR="${TMP_DIR}/preserved"
 PRESERVE=(
   "streaming.py"
   "ash_client.py"
+  "_json.py"
 )
 
 trap 'rm -rf "$TMP_DIR"' EXIT
@@ -53,6 +56,7 @@ openapi-python-client generate \
   --path "$SPEC" \
   --config "$CONFIG" \
   --output-path "$GEN_DIR" \
+  --custom-template-path "$TEMPLATES" \
   --meta none
 
 # Replace ash_sdk/ with the generated output
@@ -191,6 +191,22 @@ def test_health_response_from_dict():
     assert health.pool.max_capacity == 10
 
 
+def test_generated_endpoint_parses_response_body():
+    """Generated endpoints decode the raw response bytes into models."""
+    import httpx
+
+    from ash_sdk.api.agents import get_api_agents
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b'{"agents": [], "unexpected": true}')
+
+    client = Client(base_url="http://localhost:4100")
+    client.set_httpx_client(httpx.Client(base_url="http://localhost:4100", transport=httpx.MockTransport(handler)))
+    resp = get_api_agents.sync(client=client)
+    assert resp is not None
+    assert resp.agents == []
+
+
 def test_credential_from_dict():
     cred = Credential.from_dict({
         "id": "550e8400-e29b-41d4-a716-446655440000",
@@ -203,6 +219,41 @@ def test_credential_from_dict():
     assert cred.label == "My API Key"
 
 
+def test_nullable_fields_pass_through():
+    from ash_sdk.models import GetApiCredentialsResponse200CredentialsItem
+
+    item = GetApiCredentialsResponse200CredentialsItem.from_dict({"label": None, "lastUsedAt": "2025-01-01"})
+    assert item.label is None
+    assert item.last_used_at == "2025-01-01"
+    assert item.id is UNSET
+    assert item.to_dict() == {"label": None, "lastUsedAt": "2025-01-01"}
+
+
+def test_nullable_uuid_parsed_in_place():
+    row = {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "agentName": "a",
+        "sandboxId": "s",
+        "status": "active",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "lastActiveAt": "2025-01-01T00:00:00Z",
+    }
+    assert Session.from_dict(row).parent_session_id is UNSET
+    assert Session.from_dict({**row, "parentSessionId": None}).parent_session_id is None
+    parent = Session.from_dict({**row, "parentSessionId": "660e8400-e29b-41d4-a716-446655440000"})
+    assert parent.parent_session_id == UUID("660e8400-e29b-41d4-a716-446655440000")
+    assert parent.to_dict()["parentSessionId"] == "660e8400-e29b-41d4-a716-446655440000"
+    # A value that isn't a UUID passes through as the raw string instead of failing the whole row
+    assert Session.from_dict({**row, "parentSessionId": "not-a-uuid"}).parent_session_id == "not-a-uuid"
+    cred = Credential.from_dict({
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "type": "anthropic",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "lastUsedAt": "yesterday",
+    })
+    assert cred.last_used_at == "yesterday"
+
+
 def test_session_event_from_dict():
     evt = SessionEvent.from_dict({
         "id": "550e8400-e29b-41d4-a716-446655440000",
@@ -248,6 +299,45 @@ def test_model_additional_properties():
     assert "customField" in agent
 
 
+def test_model_additional_properties_allocated_lazily():
+    """Models without unknown fields should not carry an extras dict until one is set."""
+    data = {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "name": "test",
+        "version": 1,
+        "path": "/tmp/test",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+    }
+    agent = Agent.from_dict(data)
+    assert agent._additional_properties is None
+    assert agent.additional_keys == []
+    assert "customField" not in agent
+    assert agent == Agent.from_dict(data)
+
+    agent["customField"] = "custom_value"
+    assert agent.additional_properties == {"customField": "custom_value"}
+    assert agent.to_dict()["customField"] == "custom_value"
+
+
+def test_model_from_dict_reads_mapping_without_copying():
+    """from_dict should accept any read-only Mapping and leave the input untouched."""
+    from types import MappingProxyType
+
+    data = {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "name": "test",
+        "version": 1,
+        "path": "/tmp/test",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+        "customField": "custom_value",
+    }
+    agent = Agent.from_dict(MappingProxyType(data))
+    assert agent.additional_properties == {"customField": "custom_value"}
+    assert len(data) == 7
+
+
 # -- AshClient high-level client ---------------------------------------------------
 
 
@@ -292,3 +382,290 @@ def test_ash_client_headers_no_token():
     client = AshClient("http://localhost:4100")
     headers = client._headers()
     assert "Authorization" not in headers
+
+
+def test_ash_client_reuses_connection_pool():
+    """Requests should share one pooled httpx client instead of opening one per call."""
+    import httpx
+
+    from ash_sdk import AshClient
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, str(request.url)))
+        return httpx.Response(200, json={"status": "ok"})
+
+    with AshClient("http://localhost:4100/ash/") as client:
+        client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client.health()
+        client.health()
+        assert client._http() is client._http()
+    assert client._client is None
+    assert seen == [("GET", "http://localhost:4100/ash/health")] * 2
+
+
+def test_ash_client_pool_uses_base_url():
+    from ash_sdk import AshClient
+    with AshClient("http://localhost:4100/ash/") as client:
+        assert str(client._http().base_url) == "http://localhost:4100/ash/"
+
+
+def test_ash_client_async_stream_across_event_loops():
+    """Async streams work from separate asyncio.run() calls and leave no connection open."""
+    import asyncio
+    import gc
+    import threading
+    import warnings
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from ash_sdk import AshClient
+    from ash_sdk.streaming import DoneEvent
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep connections alive so the pool holds on to them
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = b'event: done\ndata: {"sessionId": "s1"}\n\n'
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = AshClient(f"http://127.0.0.1:{server.server_address[1]}")
+
+        async def stream():
+            return [event async for event in client.asend_message_stream("s1", "hi")]
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for _ in range(2):
+                events = asyncio.run(stream())
+                assert [type(e) for e in events] == [DoneEvent]
+            gc.collect()
+        assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_ash_client_creates_one_pool_across_threads():
+    import threading
+
+    from ash_sdk import AshClient
+
+    client = AshClient("http://localhost:4100")
+    barrier = threading.Barrier(8)
+    pools = []
+
+    def worker():
+        barrier.wait()
+        pools.append(client._http())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(pool) for pool in pools}) == 1
+    client.close()
+
+
+def test_ash_client_aclose_releases_pool():
+    import asyncio
+
+    from ash_sdk import AshClient
+
+    async def use_and_close():
+        async with AshClient("http://localhost:4100") as client:
+            pool = client._http()
+        return client, pool
+
+    client, pool = asyncio.run(use_and_close())
+    assert pool.is_closed
+    assert client._client is None
+
+
+def test_import_does_not_load_dateutil_parser():
+    import subprocess
+    import sys
+
+    code = "import sys, ash_sdk; print('dateutil.parser' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_ash_client_encodes_json_body():
+    import json
+
+    import httpx
+
+    from ash_sdk import AshClient
+
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.headers["Content-Type"], json.loads(request.content)))
+        return httpx.Response(200, json={"session": {}})
+
+    with AshClient("http://localhost:4100") as client:
+        client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._post("/api/sessions", {"agent": "héllo", "betas": ["x"]})
+    assert bodies == [("application/json", {"agent": "héllo", "betas": ["x"]})]
+
+
+def test_models_package_resolves_lazily():
+    """Every name in ash_sdk.models.__all__ should resolve through the lazy loader."""
+    import pytest
+
+    import ash_sdk.models as models
+
+    for name in models.__all__:
+        assert getattr(models, name) is not None
+    assert models.Agent is Agent
+    with pytest.raises(AttributeError):
+        models.NotAModel  # noqa: B018
+
+
+def test_parse_datetime_formats():
+    """Server timestamps parse via fromisoformat; unusual forms fall back to dateutil."""
+    from ash_sdk.types import parse_datetime
+
+    utc = datetime.timezone.utc
+    assert parse_datetime("2025-01-01T12:30:00.123Z") == datetime.datetime(2025, 1, 1, 12, 30, 0, 123000, tzinfo=utc)
+    assert parse_datetime("2025-01-01T12:30:00+00:00") == datetime.datetime(2025, 1, 1, 12, 30, tzinfo=utc)
+    assert parse_datetime("2025-01-01T12:30:00.1234567Z") == datetime.datetime(
+        2025, 1, 1, 12, 30, 0, 123456, tzinfo=utc
+    )
+
+
+def test_unset_is_singleton():
+    """Generated code checks ``is UNSET``, so copies and new instances must be the same object."""
+    import copy
+    import pickle
+
+    from ash_sdk.types import Unset
+
+    assert Unset() is UNSET
+    assert copy.deepcopy(UNSET) is UNSET
+    assert pickle.loads(pickle.dumps(UNSET)) is UNSET
+
+
+def test_response_envelopes_are_closed():
+    """Response envelope models don't collect extras; the server never sends undeclared keys."""
+    from ash_sdk.models import GetApiAgentsResponse200, GetApiQueueStatsResponse200Stats
+
+    resp = GetApiAgentsResponse200.from_dict({"agents": [], "unexpected": 1})
+    assert resp.agents == []
+    assert resp.to_dict() == {"agents": []}
+    assert not hasattr(resp, "additional_properties")
+
+    counts = {"pending": 1, "processing": 0, "completed": 2, "failed": 0, "cancelled": 0}
+    stats = GetApiQueueStatsResponse200Stats.from_dict({**counts, "unexpected": 1})
+    assert stats.to_dict() == counts
+    assert not hasattr(stats, "additional_properties")
+
+
+def test_batch_from_dict():
+    rows = [
+        {
+            "id": f"550e8400-e29b-41d4-a716-44665544000{i}",
+            "name": f"agent-{i}",
+            "version": i,
+            "path": "/tmp/test",
+            "createdAt": "2025-01-01T00:00:00Z",
+            "updatedAt": "2025-01-01T00:00:00Z",
+        }
+        for i in range(3)
+    ]
+    agents = Agent.batch_from_dict(rows)
+    assert agents == [Agent.from_dict(r) for r in rows]
+    assert [a.name for a in agents] == ["agent-0", "agent-1", "agent-2"]
+
+
+def test_model_to_dict_declared_fields_win_over_extras():
+    agent = Agent.from_dict({
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "name": "test",
+        "version": 1,
+        "path": "/tmp/test",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+        "customField": "custom_value",
+    })
+    agent["name"] = "shadowed"
+    d = agent.to_dict()
+    assert d["name"] == "test"
+    assert d["customField"] == "custom_value"
+    assert list(d)[:2] == ["customField", "name"]
+
+
+def test_credential_type_is_interned():
+    data = {
+        "id": "550e8400-e29b-41d4-a716-446655440000",
+        "type": "".join(["anth", "ropic"]),
+        "createdAt": "2025-01-01T00:00:00Z",
+    }
+    first = Credential.from_dict(data)
+    second = Credential.from_dict({**data, "type": "".join(["anth", "ropic"])})
+    assert first.type_ is second.type_
+
+
+def test_literal_enum_check():
+    import pytest
+
+    from ash_sdk.models.message_role import MESSAGE_ROLE_VALUES, check_message_role
+
+    assert isinstance(MESSAGE_ROLE_VALUES, frozenset)
+    assert check_message_role("user") == "user"
+    assert check_message_role("".join(["us", "er"])) is check_message_role("user")
+    with pytest.raises(TypeError):
+        check_message_role("system")
+
+
+def test_models_share_additional_properties_mixin():
+    from ash_sdk.types import AdditionalPropertiesMixin
+
+    stats = PoolStats.from_dict({
+        "total": 1, "cold": 0, "warming": 0, "warm": 1, "waiting": 0, "running": 0,
+        "maxCapacity": 10, "resumeWarmHits": 0, "resumeColdHits": 0, "preWarmHits": 0,
+    })
+    assert isinstance(stats, AdditionalPropertiesMixin)
+    assert not hasattr(stats, "__dict__")
+    stats["zone"] = "eu"
+    assert "zone" in stats
+    assert stats.additional_keys == ["zone"]
+
+
+def test_reference_uuids_are_shared_between_rows():
+    rows = [
+        {
+            "id": f"550e8400-e29b-41d4-a716-44665544000{i}",
+            "sessionId": "660e8400-e29b-41d4-a716-446655440000",
+            "role": "user",
+            "content": "hi",
+            "sequence": i,
+            "createdAt": "2025-01-01T00:00:00Z",
+        }
+        for i in range(2)
+    ]
+    first, second = Message.batch_from_dict(rows)
+    assert first.session_id is second.session_id
+    assert first.id != second.id
+
+
+def test_typed_additional_properties_round_trip():
+    from ash_sdk.models import PostApiSessionsBodyMcpServers, PostApiSessionsBodyMcpServersAdditionalProperty
+
+    payload = {"fs": {"command": "mcp-fs"}, "web": {"url": "http://localhost:9000"}}
+    servers = PostApiSessionsBodyMcpServers.from_dict(payload)
+    assert isinstance(servers["fs"], PostApiSessionsBodyMcpServersAdditionalProperty)
+    assert servers.to_dict() == payload
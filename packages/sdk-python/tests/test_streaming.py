@@ -1,7 +1,14 @@
 """Tests for generated API function structure, response parsing, and SSE streaming."""
 
+import asyncio
+import contextlib
+import threading
 from http import HTTPStatus
 
+import httpx
+import pytest
+
+from ash_sdk import AshClient
 from ash_sdk.api.agents import post_api_agents, get_api_agents, get_api_agents_name, delete_api_agents_name
 from ash_sdk.api.sessions import (
     post_api_sessions,
@@ -37,8 +44,12 @@ from ash_sdk.streaming import (
     SessionStartEvent,
     ErrorEvent,
     DoneEvent,
+    CoalescedTextDeltaEvent,
+    coalesce_text_deltas,
+    coalesce_text_deltas_async,
     _parse_event,
     parse_sse_stream,
+    parse_sse_stream_async,
 )
 
 
@@ -245,6 +256,13 @@ def test_parse_event_unknown():
     assert event.data == {"foo": "bar"}
 
 
+def test_stream_events_are_slotted():
+    event = _parse_event("text_delta", {"delta": "Hi"})
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.extra = 1  # type: ignore[attr-defined]
+
+
 def test_parse_sse_stream_sync():
     """Test sync SSE stream parsing with a mock httpx Response."""
     sse_lines = (
@@ -263,8 +281,8 @@ def test_parse_sse_stream_sync():
     )
 
     class MockResponse:
-        def iter_lines(self):
-            for line in sse_lines.split("\n"):
+        def iter_bytes(self, chunk_size=None):
+            for line in sse_lines.encode().splitlines(keepends=True):
                 yield line
 
     events = list(parse_sse_stream(MockResponse()))  # type: ignore[arg-type]
@@ -291,10 +309,235 @@ def test_parse_sse_stream_skips_invalid_json():
     )
 
     class MockResponse:
-        def iter_lines(self):
-            for line in sse_lines.split("\n"):
+        def iter_bytes(self, chunk_size=None):
+            for line in sse_lines.encode().splitlines(keepends=True):
                 yield line
 
     events = list(parse_sse_stream(MockResponse()))  # type: ignore[arg-type]
     assert len(events) == 1
     assert isinstance(events[0], DoneEvent)
+
+
+def test_parse_sse_stream_sync_reassembles_split_chunks():
+    """The sync parser shares the async framing: CRLF, split chunks and a missing final blank line."""
+    payload = b'event: text_delta\r\ndata: {"delta": "caf\xc3\xa9"}\r\n\r\nevent: done\ndata: {"sessionId": "s1"}'
+
+    class MockResponse:
+        def iter_bytes(self, chunk_size=None):
+            for i in range(0, len(payload), 3):
+                yield payload[i : i + 3]
+
+    events = list(parse_sse_stream(MockResponse()))  # type: ignore[arg-type]
+    assert [type(e) for e in events] == [TextDeltaEvent, DoneEvent]
+    assert events[0].delta == "café"
+
+
+def test_parse_sse_stream_handles_bare_cr_and_split_crlf():
+    """Bare CR line endings frame events, and a CRLF split across chunks counts as one line ending."""
+    chunks = [
+        b'event: text_delta\rdata: {"delta": "a"}\r\r',
+        b'event: text_delta\r\ndata: {"delta": "b"}\r',
+        b"",
+        b"\n\r",
+        b'\nevent: done\r\ndata: {"sessionId": "s1"}\r\n\r\n',
+    ]
+
+    class MockResponse:
+        def iter_bytes(self, chunk_size=None):
+            yield from chunks
+
+    events = list(parse_sse_stream(MockResponse()))  # type: ignore[arg-type]
+    assert [type(e) for e in events] == [TextDeltaEvent, TextDeltaEvent, DoneEvent]
+    assert [events[0].delta, events[1].delta] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_parse_sse_stream_async_reassembles_split_chunks():
+    """Frames split across arbitrary byte chunks should be reassembled before parsing."""
+    payload = (
+        b"event: text_delta\r\n"
+        b'data: {"delta": "caf\xc3\xa9"}\r\n'
+        b"\r\n"
+        b"event: message\n"
+        b"data: not-json\n"
+        b"\n"
+        b"event: done\n"
+        b'data: {"sessionId": "s1"}'
+    )
+
+    class MockResponse:
+        async def aiter_bytes(self, chunk_size=None):
+            for i in range(0, len(payload), 5):
+                yield payload[i : i + 5]
+
+    events = [e async for e in parse_sse_stream_async(MockResponse())]  # type: ignore[arg-type]
+    assert len(events) == 2
+    assert isinstance(events[0], TextDeltaEvent)
+    assert events[0].delta == "café"
+    assert isinstance(events[1], DoneEvent)
+    assert events[1].session_id == "s1"
+
+
+@pytest.mark.asyncio
+async def test_parse_sse_stream_async_handles_bare_cr_and_split_crlf():
+    """Bare CR line endings frame events, and a CRLF split across chunks counts as one line ending."""
+    chunks = [
+        b'event: text_delta\rdata: {"delta": "a"}\r\r',
+        b'event: text_delta\r\ndata: {"delta": "b"}\r',
+        b"",
+        b"\n\r",
+        b'\nevent: done\r\ndata: {"sessionId": "s1"}\r\n\r\n',
+    ]
+
+    class MockResponse:
+        async def aiter_bytes(self, chunk_size=None):
+            for chunk in chunks:
+                yield chunk
+
+    events = [e async for e in parse_sse_stream_async(MockResponse())]  # type: ignore[arg-type]
+    assert [type(e) for e in events] == [TextDeltaEvent, TextDeltaEvent, DoneEvent]
+    assert [events[0].delta, events[1].delta] == ["a", "b"]
+
+
+def test_parse_sse_stream_tolerates_invalid_utf8_event_name():
+    """A malformed event name is decoded with replacement characters instead of raising."""
+
+    class MockResponse:
+        def iter_bytes(self, chunk_size=None):
+            yield b'event: bad\xff\ndata: {"foo": 1}\n\nevent: done\ndata: {"sessionId": "s1"}\n\n'
+
+    events = list(parse_sse_stream(MockResponse()))  # type: ignore[arg-type]
+    assert isinstance(events[0], StreamEvent)
+    assert events[0].event == "bad\ufffd"
+    assert isinstance(events[1], DoneEvent)
+
+
+def test_parse_sse_stream_sync_yields_before_stream_ends():
+    """Each network chunk is parsed as it arrives instead of waiting for a full read buffer."""
+    first_seen = threading.Event()
+    seen_before_next_frame = []
+
+    def body():
+        yield b'event: text_delta\ndata: {"delta": "a"}\n\n'
+        # Hold the rest of the stream back until the first event has reached the caller
+        seen_before_next_frame.append(first_seen.wait(timeout=2))
+        yield b'event: done\ndata: {"sessionId": "s1"}\n\n'
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    with httpx.Client(transport=transport) as client:
+        with client.stream("GET", "http://test/stream") as response:
+            events = []
+            for event in parse_sse_stream(response):
+                events.append(event)
+                first_seen.set()
+    assert [type(e) for e in events] == [TextDeltaEvent, DoneEvent]
+    assert seen_before_next_frame == [True]
+
+
+@pytest.mark.asyncio
+async def test_parse_sse_stream_async_yields_before_stream_ends():
+    """Each network chunk is parsed as it arrives instead of waiting for a full read buffer."""
+    first_seen = asyncio.Event()
+    seen_before_next_frame = []
+
+    async def body():
+        yield b'event: text_delta\ndata: {"delta": "a"}\n\n'
+        # Hold the rest of the stream back until the first event has reached the caller
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(first_seen.wait(), timeout=2)
+        seen_before_next_frame.append(first_seen.is_set())
+        yield b'event: done\ndata: {"sessionId": "s1"}\n\n'
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    async with httpx.AsyncClient(transport=transport) as client:
+        async with client.stream("GET", "http://test/stream") as response:
+            events = []
+            async for event in parse_sse_stream_async(response):
+                events.append(event)
+                first_seen.set()
+            assert [type(e) for e in events] == [TextDeltaEvent, DoneEvent]
+    assert seen_before_next_frame == [True]
+
+
+def test_coalesce_text_deltas():
+    """Consecutive text deltas in one read are batched; other events and read boundaries flush them."""
+    batches = [
+        [
+            SessionStartEvent(session_id="s1"),
+            *[TextDeltaEvent(delta=c) for c in "abcde"],
+            MessageEvent(data={"type": "assistant"}),
+            TextDeltaEvent(delta="z"),
+        ],
+        [TextDeltaEvent(delta="y")],
+    ]
+    out = list(coalesce_text_deltas(batches, max_events=3))
+    assert [type(e) for e in out] == [
+        SessionStartEvent,
+        CoalescedTextDeltaEvent,
+        CoalescedTextDeltaEvent,
+        MessageEvent,
+        CoalescedTextDeltaEvent,
+        CoalescedTextDeltaEvent,
+    ]
+    assert out[1].delta == "abc"
+    assert out[2].delta == "de"
+    assert out[4].delta == "z"
+    assert out[5].delta == "y"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_text_deltas_async():
+    async def batches():
+        yield [TextDeltaEvent(delta="a"), TextDeltaEvent(delta="b"), DoneEvent(session_id="s1")]
+        yield [TextDeltaEvent(delta="c")]
+
+    out = [e async for e in coalesce_text_deltas_async(batches())]
+    assert [type(e) for e in out] == [CoalescedTextDeltaEvent, DoneEvent, CoalescedTextDeltaEvent]
+    assert [out[0].delta, out[2].delta] == ["ab", "c"]
+
+
+def test_ash_client_send_message_stream_coalesce():
+    """Deltas from one read are handed over together without waiting for the next read."""
+    first_seen = threading.Event()
+    seen_before_next_read = []
+
+    def body():
+        yield b'event: text_delta\ndata: {"delta": "a"}\n\nevent: text_delta\ndata: {"delta": "b"}\n\n'
+        # Hold the next read back until the first coalesced batch has reached the caller
+        seen_before_next_read.append(first_seen.wait(timeout=2))
+        yield b'event: text_delta\ndata: {"delta": "c"}\n\nevent: done\ndata: {"sessionId": "s1"}\n\n'
+
+    with AshClient("http://test") as client:
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+        client._client = httpx.Client(base_url=client.base_url, transport=transport)
+        events = []
+        for event in client.send_message_stream("s1", "hi", coalesce=True):
+            events.append(event)
+            first_seen.set()
+    assert [type(e) for e in events] == [CoalescedTextDeltaEvent, CoalescedTextDeltaEvent, DoneEvent]
+    assert [events[0].delta, events[1].delta] == ["ab", "c"]
+    assert seen_before_next_read == [True]
+
+
+@pytest.mark.asyncio
+async def test_ash_client_asend_message_stream_coalesce():
+    first_seen = asyncio.Event()
+    seen_before_next_read = []
+
+    async def body():
+        yield b'event: text_delta\ndata: {"delta": "a"}\n\nevent: text_delta\ndata: {"delta": "b"}\n\n'
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(first_seen.wait(), timeout=2)
+        seen_before_next_read.append(first_seen.is_set())
+        yield b'event: text_delta\ndata: {"delta": "c"}\n\nevent: done\ndata: {"sessionId": "s1"}\n\n'
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+    async with AshClient("http://test") as client:
+        client._ahttp = lambda: httpx.AsyncClient(base_url=client.base_url, transport=transport)  # type: ignore[method-assign]
+        events = []
+        async for event in client.asend_message_stream("s1", "hi", coalesce=True):
+            events.append(event)
+            first_seen.set()
+    assert [type(e) for e in events] == [CoalescedTextDeltaEvent, CoalescedTextDeltaEvent, DoneEvent]
+    assert [events[0].delta, events[1].delta] == ["ab", "c"]
+    assert seen_before_next_read == [True]